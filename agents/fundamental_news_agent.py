@@ -3,8 +3,9 @@ Fundamental & News Agent
 Analyzes company fundamentals and recent news following ReAct pattern
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from tools.data_fetcher import DataFetcher
+from tools.symbol_snapshot import SymbolSnapshot, format_data_age
 
 
 class FundamentalNewsAgent:
@@ -13,15 +14,19 @@ class FundamentalNewsAgent:
     Follows ReAct pattern: Reason → Act
     """
     
-    def __init__(self):
-        self.data_fetcher = DataFetcher()
+    # News items requested per analysis (the store keeps older articles)
+    NEWS_HISTORY = 20
     
-    def analyze(self, symbol: str) -> Dict[str, Any]:
+    def __init__(self, data_fetcher: Optional[DataFetcher] = None):
+        self.data_fetcher = data_fetcher or DataFetcher()
+    
+    def analyze(self, symbol: str, snapshot: Optional[SymbolSnapshot] = None) -> Dict[str, Any]:
         """
         Analyze fundamentals and news for a given symbol
         
         Args:
             symbol: Stock ticker symbol
+            snapshot: Shared per-query symbol snapshot
             
         Returns:
             Dictionary with analysis results
@@ -30,7 +35,7 @@ class FundamentalNewsAgent:
         reason = self._reason(symbol)
         
         # ACT: Fetch fundamentals and news
-        action_result = self._act(symbol)
+        action_result = self._act(symbol, snapshot)
         
         # OUTPUT: Generate structured summary
         output = self._generate_output(action_result, reason)
@@ -63,22 +68,28 @@ class FundamentalNewsAgent:
         
         return reason
     
-    def _act(self, symbol: str) -> Dict[str, Any]:
+    def _act(self, symbol: str, snapshot: Optional[SymbolSnapshot] = None) -> Dict[str, Any]:
         """
         Act: Fetch fundamentals and news
         
         Args:
             symbol: Stock ticker symbol
+            snapshot: Shared per-query symbol snapshot
             
         Returns:
             Dictionary with fundamentals and news
         """
-        fundamentals = self.data_fetcher.get_fundamentals(symbol)
-        news = self.data_fetcher.get_news(symbol, limit=5)
+        snapshot = snapshot or self.data_fetcher.snapshot(symbol)
+        fundamentals = self.data_fetcher.get_fundamentals(symbol, snapshot=snapshot)
+        news = self.data_fetcher.get_news(symbol, limit=self.NEWS_HISTORY, snapshot=snapshot)
+        
+        # Record how old the (possibly cached) data is
+        ages = [age for age in (snapshot.data_age("info"), snapshot.data_age("news")) if age is not None]
         
         return {
             "fundamentals": fundamentals,
-            "news": news
+            "news": news,
+            "data_age_seconds": max(ages) if ages else None
         }
     
     def _generate_output(self, data: Dict[str, Any], reason: str) -> str:
@@ -146,6 +157,7 @@ class FundamentalNewsAgent:
         industry = fundamentals.get("industry", "Unknown")
         output += f"\nSector: {sector}\n"
         output += f"Industry: {industry}\n"
+        output += f"Data Age: {format_data_age(data.get('data_age_seconds'))}\n"
         
         # News summary
         output += "\n**Recent News:**\n\n"
@@ -160,6 +172,8 @@ class FundamentalNewsAgent:
                     if link:
                         output += f"   Link: {link}\n"
                     output += "\n"
+            if len(news) > 5:
+                output += f"({len(news) - 5} earlier articles in news history)\n\n"
         else:
             output += "No recent news available or error fetching news.\n\n"
         
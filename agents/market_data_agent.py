@@ -3,8 +3,9 @@ Market Data Agent
 Retrieves and normalizes market-related data following ReAct pattern
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from tools.data_fetcher import DataFetcher
+from tools.symbol_snapshot import SymbolSnapshot, format_data_age
 
 
 class MarketDataAgent:
@@ -13,16 +14,22 @@ class MarketDataAgent:
     Follows ReAct pattern: Reason → Act
     """
     
-    def __init__(self):
-        self.data_fetcher = DataFetcher()
+    def __init__(self, data_fetcher: Optional[DataFetcher] = None):
+        self.data_fetcher = data_fetcher or DataFetcher()
     
-    def analyze(self, symbol: str, horizon_months: int) -> Dict[str, Any]:
+    def analyze(
+        self,
+        symbol: str,
+        horizon_months: int,
+        snapshot: Optional[SymbolSnapshot] = None
+    ) -> Dict[str, Any]:
         """
         Analyze market data for a given symbol
         
         Args:
             symbol: Stock ticker symbol
             horizon_months: Investment horizon in months
+            snapshot: Shared per-query symbol snapshot
             
         Returns:
             Dictionary with analysis results
@@ -31,7 +38,7 @@ class MarketDataAgent:
         reason = self._reason(symbol, horizon_months)
         
         # ACT: Fetch and process market data
-        action_result = self._act(symbol, horizon_months)
+        action_result = self._act(symbol, horizon_months, snapshot)
         
         # OUTPUT: Generate summary
         output = self._generate_output(action_result, reason)
@@ -65,20 +72,26 @@ class MarketDataAgent:
         reason = (
             f"Required data for {symbol}:\n"
             f"- Investment horizon: {horizon_months} months → using period: {period}\n"
-            f"- Need: price data, returns, volatility metrics\n"
+            f"- Need: price data, returns, volatility and drawdown/risk-adjusted metrics\n"
             f"- Data quality check: verify sufficient data points\n"
             f"- Trend analysis: identify price direction and momentum"
         )
         
         return reason
     
-    def _act(self, symbol: str, horizon_months: int) -> Dict[str, Any]:
+    def _act(
+        self,
+        symbol: str,
+        horizon_months: int,
+        snapshot: Optional[SymbolSnapshot] = None
+    ) -> Dict[str, Any]:
         """
         Act: Fetch market data
         
         Args:
             symbol: Stock ticker symbol
             horizon_months: Investment horizon
+            snapshot: Shared per-query symbol snapshot
             
         Returns:
             Market data dictionary
@@ -92,7 +105,16 @@ class MarketDataAgent:
             period = "6mo"
         
         # Fetch data
-        market_data = self.data_fetcher.get_market_data(symbol, period)
+        snapshot = snapshot or self.data_fetcher.snapshot(symbol)
+        market_data = self.data_fetcher.get_market_data(symbol, period, snapshot=snapshot)
+        
+        # Record how old the (possibly cached) prices are
+        if "error" not in market_data:
+            market_data["data_age_seconds"] = snapshot.data_age("history")
+            market_data["risk_metrics"] = self.data_fetcher.get_risk_metrics(symbol, period, snapshot=snapshot)
+            market_data["volatility_forecast"] = self.data_fetcher.get_volatility_forecast(
+                symbol, horizon_months, period, snapshot=snapshot
+            )
         
         return market_data
     
@@ -119,8 +141,52 @@ class MarketDataAgent:
             f"- Trend: {market_data.get('trend', 'unknown').upper()}\n"
             f"- Data Quality: {market_data.get('data_quality', 'unknown')} "
             f"({market_data.get('data_points', 0)} data points)\n"
-            f"- Observation: {'High volatility detected' if market_data.get('volatility', 0) > 30 else 'Moderate volatility'}"
+            f"- Observation: {'High volatility detected' if market_data.get('volatility', 0) > 30 else 'Moderate volatility'}\n"
+            f"- Data Age: {format_data_age(market_data.get('data_age_seconds'))}"
         )
         
+        # Helper function for safe formatting
+        def fmt(x, spec=".2f", default="N/A"):
+            return format(x, spec) if x is not None else default
+        
+        risk = market_data.get("risk_metrics") or {}
+        if risk and "error" not in risk:
+            output += (
+                f"\n\nRisk Metrics:\n"
+                f"- Max Drawdown: {fmt(risk.get('max_drawdown_pct'), '.2f')}% "
+                f"(longest {fmt(risk.get('max_drawdown_days'), 'd')} trading days below peak)\n"
+                f"- Sharpe Ratio: {fmt(risk.get('sharpe_ratio'), '.2f')}\n"
+                f"- Sortino Ratio: {fmt(risk.get('sortino_ratio'), '.2f')}\n"
+                f"- Downside Deviation: {fmt(risk.get('downside_deviation_pct'), '.2f')}%\n"
+                f"- Skew / Excess Kurtosis: {fmt(risk.get('skew'), '.2f')} / {fmt(risk.get('kurtosis'), '.2f')}"
+            )
+            if risk.get("benchmark"):
+                output += (
+                    f"\n- Beta vs {risk['benchmark']}: {fmt(risk.get('beta'), '.2f')} "
+                    f"(correlation {fmt(risk.get('correlation'), '.2f')})"
+                )
+        
+        signals = market_data.get("trend_signals") or {}
+        if signals:
+            crossover = {1: "golden cross", -1: "death cross"}.get(signals.get("crossover"))
+            breakout = {1: "above prior high", -1: "below prior low"}.get(signals.get("breakout"), "inside range")
+            output += (
+                f"\n\nTrend Signals (score {signals.get('score', 0):+d}):\n"
+                f"- SMA 20/50: {fmt(signals.get('sma_fast'), '.2f')} / {fmt(signals.get('sma_slow'), '.2f')}"
+                f"{f' ({crossover})' if crossover else ''}\n"
+                f"- EMA 20/50: {fmt(signals.get('ema_fast'), '.2f')} / {fmt(signals.get('ema_slow'), '.2f')}\n"
+                f"- 20-day Rate of Change: {fmt(signals.get('roc_pct'), '+.2f')}%\n"
+                f"- 55-day Breakout: {breakout}"
+            )
+        
+        forecast = market_data.get("volatility_forecast") or {}
+        if forecast and "error" not in forecast:
+            output += (
+                f"\n\nVolatility Forecast ({forecast.get('model', 'garch').upper()}):\n"
+                f"- Current: {fmt(forecast.get('current_volatility'), '.2f')}%\n"
+                f"- Next {forecast.get('horizon_days')} trading days: {fmt(forecast.get('forecast_volatility'), '.2f')}%\n"
+                f"- Long-run: {fmt(forecast.get('long_run_volatility'), '.2f')}%"
+            )
+        
         return output
 
@@ -121,6 +121,13 @@ class PortfolioRiskAgent:
         """
         volatility = market_data.get("volatility", 0)
         
+        # Prefer the conditional forecast over the investment horizon, which
+        # reflects the current volatility regime rather than the trailing average
+        forecast = market_data.get("volatility_forecast") or {}
+        forecast_volatility = forecast.get("forecast_volatility")
+        if forecast_volatility is not None:
+            volatility = forecast_volatility
+        
         # Calculate risk score
         risk_score = self.calculator.calculate_risk_score(
             fundamentals,
@@ -140,7 +147,8 @@ class PortfolioRiskAgent:
         return {
             "risk_score": risk_score,
             "recommendation": recommendation,
-            "volatility": volatility
+            "volatility": volatility,
+            "volatility_source": "forecast" if forecast_volatility is not None else "historical"
         }
     
     def _generate_output(self, action_result: Dict[str, Any], reason: str) -> str:
@@ -163,11 +171,12 @@ class PortfolioRiskAgent:
         recommendation = action_result.get("recommendation", {}) or {}
         risk_score = action_result.get("risk_score")
         volatility = action_result.get("volatility")
+        source = "horizon forecast" if action_result.get("volatility_source") == "forecast" else "historical"
         
         output = (
             f"Portfolio & Risk Recommendation:\n\n"
             f"Risk Score: {fmt(risk_score, '.1f')}/100\n"
-            f"Volatility: {fmt(volatility, '.2f')}%\n\n"
+            f"Volatility: {fmt(volatility, '.2f')}% ({source})\n\n"
             f"Recommendation: {recommendation.get('action', 'HOLD')}\n"
             f"Suggested Allocation: {recommendation.get('allocation', 'N/A')}\n\n"
             f"Reasoning:\n{recommendation.get('reasoning', 'No reasoning provided')}\n\n"
@@ -0,0 +1,98 @@
+"""
+Latency/throughput benchmark for Orchestrator.process_query
+
+Record fixtures once (needs network):
+    python3 benchmark.py --record fixtures/ --symbols AAPL,TSLA,NVDA
+
+Replay them offline with deterministic results:
+    python3 benchmark.py --replay fixtures/ --symbols AAPL,TSLA,NVDA --iterations 50
+
+Each iteration runs every symbol twice: once cold, right after all
+in-process caches were emptied, and once warm, answered from them.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent))
+
+from orchestrator import Orchestrator
+from tools.data_cache import DataCache
+from tools.data_fetcher import DataFetcher
+from tools.market_data_provider import RecordingProvider, ReplayProvider, YFinanceProvider
+from tools.news_store import NewsStore
+from tools.streaming_volatility import VolatilityRegistry
+from tools.upstream_guard import UpstreamGuard
+from tools.volatility_forecast import VolatilityForecasts
+
+
+def reset_caches() -> None:
+    """Empty every cache DataFetcher keeps between queries (the news store in memory only)"""
+    DataFetcher.cache = DataCache()
+    DataFetcher.rolling_volatility = VolatilityRegistry()
+    DataFetcher.volatility_forecasts = VolatilityForecasts()
+    DataFetcher.news_store = NewsStore()
+
+
+def report(label: str, latencies: list, elapsed: float) -> None:
+    latencies = sorted(latencies)
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(label)
+    print(f"  Queries:    {len(latencies)}")
+    print(f"  Mean:       {statistics.mean(latencies):.2f} ms")
+    print(f"  p50:        {statistics.median(latencies):.2f} ms")
+    print(f"  p95:        {p95:.2f} ms")
+    print(f"  Max:        {latencies[-1]:.2f} ms")
+    print(f"  Throughput: {len(latencies) / elapsed:.1f} queries/s")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--record", metavar="DIR", help="fetch live data and record fixtures to DIR")
+    mode.add_argument("--replay", metavar="DIR", help="serve all data from fixtures in DIR")
+    parser.add_argument("--symbols", default="AAPL,TSLA,NVDA", help="comma-separated symbols")
+    parser.add_argument("--risk-profile", default="moderate")
+    parser.add_argument("--horizon", type=int, default=24, help="horizon in months (24 records the longest window)")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--metrics-json", metavar="FILE", help="write per-call fetch metrics to FILE")
+    args = parser.parse_args()
+
+    symbols = [s.strip().upper() for s in args.symbols.split(",") if s.strip()]
+    if args.record:
+        DataFetcher.provider = RecordingProvider(YFinanceProvider(), args.record)
+        iterations = 1
+    else:
+        DataFetcher.provider = ReplayProvider(args.replay)
+        # Fixtures are local: the live rate limit would only add sleeps
+        DataFetcher.upstream_guard = UpstreamGuard.unthrottled()
+        iterations = args.iterations
+    # Measure the pipeline against the provider only, not warm local stores
+    DataFetcher.price_store = None
+
+    orchestrator = Orchestrator()
+    latencies = {"cold": [], "warm": []}
+    elapsed = {"cold": 0.0, "warm": 0.0}
+    for _ in range(iterations):
+        reset_caches()
+        for phase in ("cold", "warm"):
+            started = time.perf_counter()
+            for symbol in symbols:
+                t0 = time.perf_counter()
+                orchestrator.process_query(symbol, args.risk_profile, args.horizon)
+                latencies[phase].append((time.perf_counter() - t0) * 1000)
+            elapsed[phase] += time.perf_counter() - started
+
+    report("Cold (caches emptied before each iteration):", latencies["cold"], elapsed["cold"])
+    report("Warm (same queries again, served from cache):", latencies["warm"], elapsed["warm"])
+    if args.metrics_json:
+        DataFetcher.metrics.dump_json(args.metrics_json)
+        print(f"Metrics: {args.metrics_json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
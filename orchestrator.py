@@ -8,6 +8,7 @@ from typing import Dict, Any
 from agents.market_data_agent import MarketDataAgent
 from agents.fundamental_news_agent import FundamentalNewsAgent
 from agents.portfolio_risk_agent import PortfolioRiskAgent
+from tools.data_fetcher import DataFetcher
 from tools.tabular_demo import answer_highest_net_income, TABULAR_DATA
 
 
@@ -17,8 +18,10 @@ class Orchestrator:
     """
     
     def __init__(self):
-        self.market_data_agent = MarketDataAgent()
-        self.fundamental_news_agent = FundamentalNewsAgent()
+        # One fetcher shared by the data agents
+        self.data_fetcher = DataFetcher()
+        self.market_data_agent = MarketDataAgent(self.data_fetcher)
+        self.fundamental_news_agent = FundamentalNewsAgent(self.data_fetcher)
         self.portfolio_risk_agent = PortfolioRiskAgent()
     
     def process_query(
@@ -38,12 +41,15 @@ class Orchestrator:
         Returns:
             Complete analysis with all agent outputs and final answer
         """
+        # Shared snapshot: each data type is fetched once for all agents
+        snapshot = self.data_fetcher.snapshot(symbol)
+        
         # Step 1: Market Data Agent
-        market_result = self.market_data_agent.analyze(symbol, horizon_months)
+        market_result = self.market_data_agent.analyze(symbol, horizon_months, snapshot)
         market_data = market_result.get("action", {})
         
         # Step 2: Fundamental & News Agent
-        fundamental_result = self.fundamental_news_agent.analyze(symbol)
+        fundamental_result = self.fundamental_news_agent.analyze(symbol, snapshot)
         fundamental_data = fundamental_result.get("action", {})
         fundamentals = fundamental_data.get("fundamentals", {})
         
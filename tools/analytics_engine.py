@@ -0,0 +1,117 @@
+"""
+Analytics Engine
+Column-wise returns and volatility over a date-by-symbol close matrix
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+TRADING_DAYS = 252
+
+
+@dataclass
+class MarketSummary:
+    """
+    Per-column statistics of a close matrix, one array entry per symbol.
+
+    Columns without any valid close have ``last_index`` -1 and zeros for
+    the price fields.
+    """
+
+    last_index: np.ndarray
+    current: np.ndarray
+    previous: np.ndarray
+    change: np.ndarray
+    change_pct: np.ndarray
+    volatility: np.ndarray
+    data_points: np.ndarray
+
+    @property
+    def has_data(self) -> np.ndarray:
+        return self.last_index >= 0
+
+    @property
+    def upward(self) -> np.ndarray:
+        return self.change > 0
+
+
+def daily_returns(closes: np.ndarray) -> np.ndarray:
+    """
+    Simple returns between consecutive rows (NaN where either close is missing)
+
+    Args:
+        closes: 1-D series or 2-D date-by-symbol matrix
+
+    Returns:
+        Array with one row fewer than closes
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return closes[1:] / closes[:-1] - 1
+
+
+def annualized_volatility(returns: np.ndarray, periods_per_year: int = TRADING_DAYS) -> np.ndarray:
+    """
+    Sample standard deviation of the finite returns per column, annualized, in percent
+
+    Args:
+        returns: 1-D series or 2-D date-by-symbol matrix of returns
+        periods_per_year: Return observations per year
+
+    Returns:
+        Volatility per column (scalar array for a 1-D input); NaN with fewer
+        than two finite returns
+    """
+    finite = np.isfinite(returns)
+    count = finite.sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.where(finite, returns, 0.0).sum(axis=0) / count
+        deviations = np.where(finite, returns - mean, 0.0)
+        variance = (deviations * deviations).sum(axis=0) / (count - 1)
+    volatility = np.sqrt(variance) * np.sqrt(periods_per_year) * 100
+    return np.where(count > 1, volatility, np.nan)
+
+
+def summarize_closes(closes: np.ndarray, periods_per_year: int = TRADING_DAYS) -> MarketSummary:
+    """
+    Price change, volatility and data coverage for every column at once
+
+    Missing closes (NaN) are allowed anywhere: each column's current and
+    previous prices are its last two valid closes.
+
+    Args:
+        closes: Date-by-symbol matrix of closes, oldest row first
+        periods_per_year: Return observations per year
+
+    Returns:
+        MarketSummary with one entry per column
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    if closes.ndim == 1:
+        closes = closes[:, None]
+
+    valid = ~np.isnan(closes)
+    rows = np.arange(len(closes))[:, None]
+    last_index = np.where(valid, rows, -1).max(axis=0, initial=-1)
+    prev_index = np.where(valid & (rows < last_index), rows, -1).max(axis=0, initial=-1)
+    prev_index = np.where(prev_index < 0, last_index, prev_index)
+
+    cols = np.arange(closes.shape[1])
+    has_data = last_index >= 0
+    current = np.where(has_data, closes[np.maximum(last_index, 0), cols] if len(closes) else 0.0, 0.0)
+    previous = np.where(has_data, closes[np.maximum(prev_index, 0), cols] if len(closes) else 0.0, 0.0)
+
+    change = current - previous
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change_pct = np.where(previous > 0, change / previous * 100, 0.0)
+
+    return MarketSummary(
+        last_index=last_index,
+        current=current,
+        previous=previous,
+        change=change,
+        change_pct=change_pct,
+        volatility=annualized_volatility(daily_returns(closes), periods_per_year),
+        data_points=valid.sum(axis=0),
+    )
@@ -0,0 +1,56 @@
+"""
+Cache Files
+Atomic file replacement and default locations for the on-disk caches
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator, Optional
+
+
+def cache_dir(env_var: str, name: str) -> Path:
+    """
+    Directory of an on-disk cache
+
+    Args:
+        env_var: Environment variable that overrides the location
+        name: Subdirectory of ``.cache`` in the project root otherwise
+
+    Returns:
+        Directory path (not created)
+    """
+    root = os.environ.get(env_var)
+    if root:
+        return Path(root).expanduser()
+    return Path(__file__).resolve().parent.parent / ".cache" / name
+
+
+@contextmanager
+def atomic_write(path: Path, mode: str = "wb", encoding: Optional[str] = None) -> Iterator[IO]:
+    """
+    Open a temporary file next to ``path`` that replaces it on success
+
+    Readers see either the old file or the complete new one, never a
+    partial write; if the block raises, the temporary file is removed and
+    ``path`` is left untouched. Missing parent directories are created.
+
+    Args:
+        path: File to write
+        mode: "wb" or "w"
+        encoding: Text encoding for mode "w"
+
+    Yields:
+        File handle to write the new contents to
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode, encoding=encoding) as handle:
+            yield handle
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
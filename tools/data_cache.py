@@ -0,0 +1,160 @@
+"""
+Data Cache
+Tiered cache for upstream data with market-hours-aware time-to-live
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Hashable, Optional
+
+from tools.cache_files import cache_dir
+from tools.fetch_metrics import symbol_class
+from tools.market_hours import is_market_open, next_market_open
+from tools.tiered_cache import DiskTier, MemoryTier, TieredCache
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    stored_at: float
+    expires_at: float
+
+
+class DataCache:
+    """
+    Key/value cache whose entry lifetime depends on the kind of data stored.
+
+    Expired entries are kept for up to ``max_stale`` seconds so they can
+    still be served as a fallback while the upstream is unavailable.
+    Entries live in a TieredCache; by default that is a bounded in-process
+    LRU only, and ``default()`` adds a local disk tier behind it.
+
+    Field classes:
+        - ``fundamentals``: ratios and company info, which change at most daily
+        - ``quote``: prices and history; short-lived while the market is open,
+          valid until the next open while it is closed (stocks and indices
+          only; crypto, FX and futures trade outside exchange hours)
+        - ``news``: headlines, refreshed every few minutes
+        - ``negative``: "no data" results for unknown or delisted symbols
+    """
+
+    # Seconds each field class stays fresh while the market is open
+    DEFAULT_TTLS = {
+        "fundamentals": 24 * 3600,
+        "quote": 60,
+        "news": 15 * 60,
+        "negative": 3600,
+    }
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        max_stale: float = 24 * 3600,
+        store: Optional[TieredCache] = None
+    ):
+        self.ttls = dict(self.DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.max_stale = max_stale
+        self.store = store if store is not None else TieredCache([MemoryTier()])
+
+    @classmethod
+    def default(cls) -> "DataCache":
+        """Memory LRU backed by a disk tier under ``DATA_CACHE_DIR`` or ``.cache/data``"""
+        return cls(store=TieredCache([MemoryTier(), DiskTier(cache_dir("DATA_CACHE_DIR", "data"))]))
+
+    def ttl_for(self, field_class: str, now: Optional[float] = None, symbol: Optional[str] = None) -> float:
+        """
+        Time-to-live in seconds for a field class at a given time
+
+        Args:
+            field_class: One of the keys in ``ttls``
+            now: Epoch seconds (defaults to the current time)
+            symbol: Symbol the entry belongs to; quotes for crypto, FX and
+                futures keep the open-market TTL around the clock
+
+        Returns:
+            Seconds until an entry stored now should expire
+        """
+        if field_class not in self.ttls:
+            raise ValueError(f"Unknown field class: {field_class}")
+        now = time.time() if now is None else now
+        ttl = self.ttls[field_class]
+        if field_class == "quote" and symbol_class(symbol) in ("equity", "index", "none"):
+            moment = datetime.fromtimestamp(now, tz=timezone.utc)
+            if not is_market_open(moment):
+                # Nothing trades until the next open
+                ttl = max(ttl, next_market_open(moment).timestamp() - now)
+        return ttl
+
+    def get(self, key: Hashable, local: bool = False) -> Optional[Any]:
+        """
+        Fresh value for a key
+
+        Args:
+            key: Cache key
+            local: Only look in the in-process tier
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self.get_entry(key, local)
+        if entry is None or entry.expires_at <= time.time():
+            return None
+        return entry.value
+
+    def get_entry(self, key: Hashable, local: bool = False) -> Optional[CacheEntry]:
+        """
+        Entry for a key, including expired entries still within max_stale
+
+        Args:
+            key: Cache key
+            local: Only look in the in-process tier
+
+        Returns:
+            CacheEntry, or None if missing or too stale to serve
+        """
+        entry = self.store.get(key, local=local)
+        if entry is None:
+            return None
+        if entry.expires_at + self.max_stale <= time.time():
+            self.store.delete(key)
+            return None
+        return entry
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        field_class: str,
+        local: bool = False,
+        symbol: Optional[str] = None
+    ) -> None:
+        """
+        Store a value with the TTL of its field class
+
+        Args:
+            key: Cache key
+            value: Value to store
+            field_class: Field class that determines the TTL
+            local: Keep the value in the in-process tier only (never on disk)
+            symbol: Symbol the value belongs to (see ``ttl_for``)
+        """
+        now = time.time()
+        ttl = self.ttl_for(field_class, now, symbol)
+        self.store.set(key, CacheEntry(value, now, now + ttl), local=local)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one key, or everything when key is None"""
+        if key is None:
+            self.store.clear()
+        else:
+            self.store.delete(key)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit/miss/eviction counters and sizes per storage tier"""
+        return self.store.stats()
+
+    def __len__(self) -> int:
+        return len(self.store)
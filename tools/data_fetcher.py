@@ -3,71 +3,689 @@ Data Fetcher Tool
 Retrieves market data, fundamentals, and news
 """
 
-import yfinance as yf
+import asyncio
+import functools
+import math
+import threading
+import time
+import weakref
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from tools.analytics_engine import TRADING_DAYS, MarketSummary, summarize_closes
+from tools.data_cache import DataCache
+from tools.fetch_metrics import FetchMetrics
+from tools.market_data_provider import QUOTE_FIELDS, MarketDataProvider
+from tools.news_store import NewsStore, normalize_news_item
+from tools.price_history import PriceHistory
+from tools.price_store import PERIOD_DAYS, PriceStore
+from tools.shared_price_store import SharedPriceStore
+from tools.risk_metrics import compute_risk_metrics
+from tools.single_flight import SingleFlight
+from tools.streaming_volatility import VolatilityRegistry
+from tools.tiered_cache import estimate_size
+from tools.trend_engine import TrendSignals, analyze_trend
+from tools.ticker_universe import TickerUniverse
+from tools.upstream_guard import UpstreamGuard
+from tools.volatility_forecast import VolatilityForecasts
+from tools.symbol_snapshot import SymbolSnapshot
+
+
+# Fields of a news item returned by get_news
+_NEWS_FIELDS = ("title", "publisher", "link", "published")
+
+
+class _HistoryWindow:
+    """Longest price history loaded for a symbol, tagged with its period"""
+    
+    def __init__(self, period: str, history: PriceHistory):
+        self.period = period
+        self.history = history
+    
+    def covers(self, period: str) -> bool:
+        return self.period == period or (
+            period in PERIOD_DAYS and PERIOD_DAYS.get(self.period, 0) >= PERIOD_DAYS[period]
+        )
+    
+    def __len__(self) -> int:
+        return len(self.history)
+
+
+def _timed(method: str):
+    """Record each call of a DataFetcher method in DataFetcher.metrics"""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            metrics = DataFetcher.metrics
+            if metrics is None:
+                return func(*args, **kwargs)
+            # First str/list argument is the symbol(s); skips cls
+            symbol = next((arg for arg in args if isinstance(arg, (str, list))), None)
+            with metrics.timed(method, symbol) as call:
+                result = func(*args, **kwargs)
+                call.result(result)
+                return result
+        return wrapper
+    return decorate
 
 
 class DataFetcher:
     """Fetches financial data from various sources"""
     
+    # Upstream source (live yfinance, or record/replay fixtures via env vars)
+    provider: MarketDataProvider = MarketDataProvider.from_env()
+    
+    # Listed symbols; unknown symbols are rejected before any network call
+    universe: TickerUniverse = TickerUniverse.default()
+    
+    # Process-wide on-disk OHLCV cache (set to None to always fetch full history)
+    price_store: Optional[PriceStore] = PriceStore.default()
+    
+    # Memory-mapped bars shared between processes on this host (SHARED_PRICE_STORE_DIR)
+    shared_prices: Optional[SharedPriceStore] = SharedPriceStore.from_env()
+    
+    # Deduplicated per-symbol news history (set to None to only use the live feed)
+    news_store: Optional[NewsStore] = NewsStore.default()
+    
+    # Market-hours-aware TTL cache for raw upstream data (set to None to disable)
+    cache: Optional[DataCache] = DataCache.default()
+    
+    # Coalesces concurrent identical loads into one upstream call
+    single_flight: SingleFlight = SingleFlight()
+    
+    # Rate limiter, retries and circuit breaker around every upstream call
+    upstream_guard: UpstreamGuard = UpstreamGuard()
+    
+    # Rolling volatility per (symbol, period), updated per new bar (set to None to rescan)
+    rolling_volatility: Optional[VolatilityRegistry] = VolatilityRegistry()
+    
+    # Conditional volatility forecasts per symbol (GARCH(1,1); model="ewma" for RiskMetrics)
+    volatility_forecasts: VolatilityForecasts = VolatilityForecasts()
+    
+    # Benchmark for beta and correlation; its history is loaded once and shared
+    benchmark_symbol: str = "SPY"
+    
+    # Latency, payload size and cache outcome per call (set to None to disable)
+    metrics: Optional[FetchMetrics] = FetchMetrics()
+    
+    # Serve expired cache entries immediately and refresh them in the background
+    stale_while_revalidate: bool = False
+    _refresh_executor: Optional[ThreadPoolExecutor] = None
+    _refreshing: set = set()
+    _refresh_lock = threading.Lock()
+    
+    # Makes the check and write of _cached(keep=...) one step
+    _write_lock = threading.Lock()
+    
+    # Upper bound on fetches in flight from the async API (see set_max_concurrency)
+    max_concurrency: int = 16
+    _executor: Optional[ThreadPoolExecutor] = None
+    _semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+        weakref.WeakKeyDictionary()
+    )
+    
+    @classmethod
+    def snapshot(cls, symbol: str) -> SymbolSnapshot:
+        """
+        Create a per-query snapshot that loads through this fetcher
+        
+        Args:
+            symbol: Stock ticker symbol
+            
+        Returns:
+            SymbolSnapshot for the symbol
+        """
+        return SymbolSnapshot(symbol, cls)
+    
+    @classmethod
+    @_timed("load_history")
+    def load_history(cls, symbol: str, period: str) -> PriceHistory:
+        """
+        Price history, served from cache, the shared store, the price store
+        or the provider
+        
+        Only the longest window loaded per symbol is cached, as compact
+        arrays; shorter periods are answered by slicing it (e.g. 6mo out of
+        a cached 2y) without copying.
+        
+        Args:
+            symbol: Stock ticker symbol
+            period: Time period (6mo, 1y, 2y, etc.)
+            
+        Returns:
+            PriceHistory (may be empty); call to_frame() for a DataFrame
+        """
+        key = ("history", symbol.upper())
+        local = cls.shared_prices is not None
+        
+        def fetch(period):
+            shared = cls._shared_history(symbol, period)
+            if shared is not None:
+                return shared
+            if cls.price_store is not None:
+                frame = cls.price_store.history(symbol, period, cls.provider)
+            else:
+                frame = cls.provider.history(symbol, period=period)
+            history = PriceHistory.from_frame(frame)
+            if cls.shared_prices is not None and cls.shared_prices.writer:
+                cls.shared_prices.write(symbol, history, period)
+                # Serve the mapped copy so this process shares pages too
+                mapped = cls.shared_prices.read(symbol, period)
+                if mapped is not None:
+                    history = mapped
+            return history
+        
+        def fetch_window():
+            # Refresh the longest window held, even an expired one, so a
+            # shorter request never replaces it
+            fetch_period = period
+            entry = cls.cache.get_entry(key, local) if cls.cache is not None else None
+            if entry is not None and entry.value.covers(period):
+                fetch_period = entry.value.period
+            return _HistoryWindow(fetch_period, fetch(fetch_period))
+        
+        window = cls._cached(
+            key,
+            "quote",
+            fetch_window,
+            accept=lambda cached: cached.covers(period),
+            flight_key=("history", symbol.upper(), period),
+            missing=lambda window: len(window) == 0,
+            # Loads of different periods run concurrently; a shorter window
+            # must not replace a longer one stored in the meantime
+            keep=lambda cached, fetched: not fetched.covers(cached.period),
+            # With a shared store the mapped file is the cross-process copy;
+            # pickling windows to the disk tier would give each process its own
+            local=local
+        )
+        if window.period == period:
+            return window.history
+        return window.history.slice_to_period(period)
+    
+    @classmethod
+    def _shared_history(cls, symbol: str, period: str) -> Optional[PriceHistory]:
+        """
+        History from the shared store if another process wrote it recently
+        
+        A file counts as fresh for as long as a quote stored at its last
+        write would (see DataCache.ttl_for); older files are ignored so this
+        process fetches for itself.
+        """
+        shared = cls.shared_prices
+        if shared is None:
+            return None
+        written_at = shared.written_at(symbol)
+        if written_at is None:
+            return None
+        if cls.cache is not None and written_at + cls.cache.ttl_for("quote", written_at, symbol) <= time.time():
+            return None
+        return shared.read(symbol, period)
+    
+    @classmethod
+    @_timed("load_info")
+    def load_info(cls, symbol: str) -> Dict:
+        """Raw company info payload, cached as fundamentals"""
+        return cls._cached(
+            ("info", symbol.upper()),
+            "fundamentals",
+            lambda: cls.provider.info(symbol),
+            missing=lambda info: not any(info.get(k) for k in cls._INFO_IDENTITY_FIELDS) if info else True
+        )
+    
+    @classmethod
+    @_timed("load_quote")
+    def load_quote(cls, symbol: str, fields: Tuple[str, ...] = QUOTE_FIELDS) -> Dict:
+        """
+        Lightweight quote fields, cached as quote
+        
+        Only the requested fields are fetched upstream. They are merged into
+        the cached quote snapshot, so a later request for any field already
+        fetched is answered locally until the quote expires.
+        
+        Args:
+            symbol: Stock ticker symbol
+            fields: Subset of last_price, previous_close and market_cap
+            
+        Returns:
+            Dict with the requested fields (None when unavailable)
+        """
+        key = ("quote", symbol.upper())
+        fields = tuple(fields)
+        
+        def fetch():
+            current = cls.cache.get(key) if cls.cache is not None else None
+            return {**(current or {}), **cls.provider.quote(symbol, fields)}
+        
+        return cls._cached(
+            key,
+            "quote",
+            fetch,
+            accept=lambda quote: all(field in quote for field in fields),
+            flight_key=key + fields,
+            missing=lambda quote: all(value is None for value in quote.values())
+        )
+    
+    @classmethod
+    @_timed("load_news")
+    def load_news(cls, symbol: str) -> List[Dict]:
+        """Raw news items, cached as news"""
+        return cls._cached(("news", symbol.upper()), "news", lambda: cls.provider.news(symbol))
+    
+    @classmethod
+    def data_age(cls, kind: str, symbol: str) -> Optional[float]:
+        """
+        Seconds since the cached data of a kind was fetched from the upstream
+        
+        Args:
+            kind: "history", "info", "quote" or "news"
+            symbol: Stock ticker symbol
+            
+        Returns:
+            Age in seconds, or None if nothing is cached
+        """
+        if cls.cache is None:
+            return None
+        entry = cls.cache.get_entry((kind, symbol.upper()))
+        if entry is None:
+            return None
+        return max(0.0, time.time() - entry.stored_at)
+    
+    # Unknown symbols get an info payload without any of these fields
+    _INFO_IDENTITY_FIELDS = ("quoteType", "symbol", "shortName", "longName", "marketCap")
+    
+    @classmethod
+    def is_known_missing(cls, kind: str, symbol: str) -> bool:
+        """
+        Whether a recent load of a kind returned nothing for this symbol
+        
+        Args:
+            kind: "history", "info" or "quote"
+            symbol: Stock ticker symbol
+            
+        Returns:
+            True while the negative cache entry is fresh
+        """
+        return cls.cache is not None and cls.cache.get(("missing", kind, symbol.upper())) is not None
+    
+    @classmethod
+    def _cached(
+        cls,
+        key: Hashable,
+        field_class: str,
+        fetch: Callable[[], Any],
+        accept: Optional[Callable[[Any], bool]] = None,
+        flight_key: Optional[Hashable] = None,
+        missing: Optional[Callable[[Any], bool]] = None,
+        local: bool = False,
+        keep: Optional[Callable[[Any, Any], bool]] = None
+    ) -> Any:
+        """
+        Return a fresh cached value or fetch and cache it
+        
+        Concurrent misses for the same key share a single fetch. Empty
+        results are not cached. If the upstream fails (or the circuit
+        breaker is open) an expired entry is served when one is available.
+        With stale_while_revalidate, an expired entry is returned right away
+        and refreshed on a background thread. Results for which ``missing``
+        is true (unknown or delisted symbols) go to the negative cache and
+        are answered locally until it expires. With ``keep``, a fetched
+        value is returned but not written over a fresh cached value that
+        ``keep(cached, fetched)`` prefers, as when concurrent fetches under
+        different flight keys share one cache key.
+        
+        Args:
+            key: Cache key
+            field_class: DataCache field class deciding the TTL
+            fetch: Upstream call producing the value
+            accept: Whether a cached value satisfies this request (default: any)
+            flight_key: Key for coalescing concurrent fetches (default: key)
+            missing: Whether a fetched value means the symbol has no data
+            local: Keep the value in the in-process cache tier only
+            keep: Whether a fresh cached value should stay over a fetched one
+        """
+        cache = cls.cache
+        accept = accept or (lambda value: True)
+        negative_key = ("missing",) + tuple(key)
+        note_cache = cls.metrics.note_cache if cls.metrics is not None else (lambda outcome: None)
+        
+        def cached_value():
+            if cache is None:
+                return None
+            value = cache.get(key, local)
+            if value is not None and accept(value):
+                note_cache("hit")
+                return value
+            if missing is not None:
+                value = cache.get(negative_key)
+                if value is not None:
+                    note_cache("negative")
+                return value
+            return None
+        
+        def stale_value():
+            entry = cache.get_entry(key, local) if cache is not None else None
+            return entry.value if entry is not None and accept(entry.value) else None
+        
+        def refresh():
+            note_cache("miss")
+            value = cls._call_upstream(key[0], key[1], fetch)
+            if cache is None or value is None:
+                return value
+            if missing is not None and missing(value):
+                cache.set(negative_key, value, "negative")
+                cache.invalidate(key)
+            elif len(value) > 0:
+                if keep is None:
+                    cache.set(key, value, field_class, local, symbol=key[1])
+                    return value
+                with cls._write_lock:
+                    current = cache.get(key, local)
+                    if current is None or not keep(current, value):
+                        cache.set(key, value, field_class, local, symbol=key[1])
+            return value
+        
+        def load():
+            # Another caller may have filled the cache while we waited for the lock
+            value = cached_value()
+            if value is not None:
+                return value
+            try:
+                return refresh()
+            except Exception:
+                value = stale_value()
+                if value is None:
+                    raise
+                note_cache("stale_fallback")
+                return value
+        
+        flight_key = flight_key or key
+        value = cached_value()
+        if value is not None:
+            return value
+        
+        if cls.stale_while_revalidate:
+            value = stale_value()
+            if value is not None:
+                note_cache("stale")
+                cls._refresh_in_background(flight_key, load)
+                return value
+        
+        # Callers that wait on another thread's fetch keep this outcome
+        note_cache("coalesced")
+        return cls.single_flight.do(flight_key, load)
+    
+    @classmethod
+    def _call_upstream(cls, kind: str, symbol: Any, fetch: Callable[[], Any]) -> Any:
+        """Guarded upstream call, timed as upstream.<kind> with its payload size"""
+        if cls.metrics is None:
+            return cls.upstream_guard.call(fetch)
+        with cls.metrics.timed(f"upstream.{kind}", symbol) as call:
+            value = cls.upstream_guard.call(fetch)
+            call.result(value)
+            call.nbytes = estimate_size(value)
+            return value
+    
+    @classmethod
+    def _refresh_in_background(cls, flight_key: Hashable, load: Callable[[], Any]) -> None:
+        """Run a cache refresh on the background pool unless one is already queued"""
+        with cls._refresh_lock:
+            if flight_key in cls._refreshing:
+                return
+            cls._refreshing.add(flight_key)
+            if cls._refresh_executor is None:
+                cls._refresh_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cache-refresh")
+        
+        def run():
+            try:
+                cls.single_flight.do(flight_key, load)
+            except Exception:
+                pass  # The stale entry stays in place; the next request retries
+            finally:
+                with cls._refresh_lock:
+                    cls._refreshing.discard(flight_key)
+        
+        cls._refresh_executor.submit(run)
+    
     @staticmethod
-    def get_market_data(symbol: str, period: str = "1y") -> Dict:
+    @_timed("get_market_data")
+    def get_market_data(
+        symbol: str,
+        period: str = "1y",
+        snapshot: Optional[SymbolSnapshot] = None
+    ) -> Dict:
         """
         Fetch market data for a symbol
         
         Args:
             symbol: Stock ticker symbol
             period: Time period (1y, 2y, etc.)
+            snapshot: Shared per-query snapshot (a private one is used if omitted)
             
         Returns:
             Dictionary with price data and statistics
         """
+        if not DataFetcher.universe.contains(symbol):
+            return {"error": f"Unknown symbol: {symbol}"}
+        
+        try:
+            snapshot = snapshot or DataFetcher.snapshot(symbol)
+            hist = snapshot.history(period)
+            
+            if hist.is_empty:
+                return {"error": f"No data found for {symbol}"}
+            
+            streams = DataFetcher.rolling_volatility
+            if streams is None:
+                summary = summarize_closes(hist.closes[:, None])
+            else:
+                # Price fields only need the last two closes; volatility comes
+                # from the incremental per-(symbol, period) stream
+                summary = summarize_closes(hist.closes[-2:, None])
+                summary.volatility = np.array([streams.sync(symbol, period, hist)])
+                summary.data_points = np.array([len(hist)])
+            return DataFetcher._market_data_result(symbol, period, summary, analyze_trend(hist.closes), 0)
+        except Exception as e:
+            return {"error": f"Error fetching market data: {str(e)}"}
+    
+    @staticmethod
+    @_timed("get_market_data_many")
+    def get_market_data_many(symbols: List[str], period: str = "1y") -> Dict[str, Dict]:
+        """
+        Fetch market data for many symbols in one batched download
+        
+        Computes the same fields as get_market_data for every symbol at once
+        with the vectorized analytics engine.
+        
+        Args:
+            symbols: Stock ticker symbols
+            period: Time period (1y, 2y, etc.)
+            
+        Returns:
+            Dictionary mapping each symbol to its market data (or error) dictionary
+        """
+        symbols = list(dict.fromkeys(s.upper() for s in symbols))
+        unknown = [s for s in symbols if not DataFetcher.universe.contains(s)]
+        results = {symbol: {"error": f"Unknown symbol: {symbol}"} for symbol in unknown}
+        # Symbols that recently returned no history are answered from the negative cache
+        for symbol in symbols:
+            if symbol not in results and DataFetcher.is_known_missing("history", symbol):
+                results[symbol] = {"error": f"No data found for {symbol}"}
+        symbols = [s for s in symbols if s not in results]
+        if not symbols:
+            return results
+        
         try:
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period=period)
+            closes = DataFetcher._call_upstream(
+                "closes", symbols, lambda: DataFetcher.provider.closes(symbols, period)
+            )
+        except Exception as e:
+            results.update({symbol: {"error": f"Error fetching market data: {str(e)}"} for symbol in symbols})
+            return results
+        
+        if closes.empty:
+            results.update({symbol: {"error": f"No data found for {symbol}"} for symbol in symbols})
+            return results
+        
+        # One pass over the date-by-symbol matrix for all symbols
+        matrix = closes.reindex(columns=symbols).to_numpy(dtype="float64")
+        summary = summarize_closes(matrix)
+        trend = analyze_trend(matrix)
+        # Symbols with a single close have no volatility; report 0 rather than NaN
+        summary.volatility = np.nan_to_num(summary.volatility)
+        
+        for i, symbol in enumerate(symbols):
+            if not summary.has_data[i]:
+                results[symbol] = {"error": f"No data found for {symbol}"}
+                if DataFetcher.cache is not None:
+                    DataFetcher.cache.set(("missing", "history", symbol), _HistoryWindow(period, PriceHistory.empty()), "negative")
+                continue
+            results[symbol] = DataFetcher._market_data_result(symbol, period, summary, trend, i)
+        
+        return results
+    
+    @staticmethod
+    def _market_data_result(
+        symbol: str,
+        period: str,
+        summary: MarketSummary,
+        trend: TrendSignals,
+        i: int
+    ) -> Dict:
+        """get_market_data fields for column i of a MarketSummary and TrendSignals"""
+        data_points = int(summary.data_points[i])
+        return {
+            "symbol": symbol,
+            "current_price": round(float(summary.current[i]), 2),
+            "price_change": round(float(summary.change[i]), 2),
+            "price_change_pct": round(float(summary.change_pct[i]), 2),
+            "volatility": round(float(summary.volatility[i]), 2),  # Annualized
+            "data_points": data_points,
+            "period": period,
+            "trend": str(trend.label[i]),
+            "trend_signals": trend.to_dict(i),
+            "data_quality": "good" if data_points > 50 else "limited"
+        }
+    
+    @staticmethod
+    @_timed("get_risk_metrics")
+    def get_risk_metrics(
+        symbol: str,
+        period: str = "1y",
+        snapshot: Optional[SymbolSnapshot] = None
+    ) -> Dict:
+        """
+        Drawdown, Sharpe/Sortino, higher moments and benchmark beta for a symbol
+        
+        The benchmark history is loaded for at least 2y through the shared
+        cache, so every symbol and horizon reuses the same download.
+        
+        Args:
+            symbol: Stock ticker symbol
+            period: Time period (1y, 2y, etc.)
+            snapshot: Shared per-query snapshot (a private one is used if omitted)
             
-            if hist.empty:
+        Returns:
+            Dictionary of risk metrics (None where there is not enough data)
+        """
+        if not DataFetcher.universe.contains(symbol):
+            return {"error": f"Unknown symbol: {symbol}"}
+        
+        try:
+            snapshot = snapshot or DataFetcher.snapshot(symbol)
+            hist = snapshot.history(period)
+            if hist.is_empty:
                 return {"error": f"No data found for {symbol}"}
             
-            current_price = hist['Close'].iloc[-1]
-            prev_price = hist['Close'].iloc[-2] if len(hist) > 1 else current_price
-            price_change = current_price - prev_price
-            price_change_pct = (price_change / prev_price) * 100 if prev_price > 0 else 0
+            benchmark = None
+            if symbol.upper() != DataFetcher.benchmark_symbol:
+                benchmark_period = period if PERIOD_DAYS.get(period, 0) > PERIOD_DAYS["2y"] else "2y"
+                try:
+                    benchmark = DataFetcher.load_history(DataFetcher.benchmark_symbol, benchmark_period)
+                    # Cut at the symbol's first bar rather than the wall clock, so
+                    # replayed fixtures give the same beta however old they are
+                    benchmark = benchmark[int(np.searchsorted(benchmark.dates, hist.dates[0])):]
+                except Exception:
+                    benchmark = None  # Beta and correlation are left empty
             
-            # Calculate returns
-            returns = hist['Close'].pct_change().dropna()
-            volatility = returns.std() * (252 ** 0.5) * 100  # Annualized volatility
+            metrics = compute_risk_metrics(
+                hist.closes,
+                hist.dates,
+                benchmark.closes if benchmark is not None else None,
+                benchmark.dates if benchmark is not None else None
+            )
+            result = {k: round(v, 2) if isinstance(v, float) else v for k, v in metrics.items()}
+            result["benchmark"] = DataFetcher.benchmark_symbol if benchmark is not None else None
+            return result
+        except Exception as e:
+            return {"error": f"Error computing risk metrics: {str(e)}"}
+    
+    @staticmethod
+    @_timed("get_volatility_forecast")
+    def get_volatility_forecast(
+        symbol: str,
+        horizon_months: int,
+        period: str = "1y",
+        snapshot: Optional[SymbolSnapshot] = None
+    ) -> Dict:
+        """
+        Conditional volatility forecast averaged over an investment horizon
+        
+        The model state is kept per symbol and only advanced by new bars,
+        so repeated queries do not refit it.
+        
+        Args:
+            symbol: Stock ticker symbol
+            horizon_months: Investment horizon in months
+            period: History used to fit the model (1y, 2y, etc.)
+            snapshot: Shared per-query snapshot (a private one is used if omitted)
+            
+        Returns:
+            Dictionary with current, forecast and long-run annualized volatility (%)
+        """
+        if not DataFetcher.universe.contains(symbol):
+            return {"error": f"Unknown symbol: {symbol}"}
+        
+        try:
+            snapshot = snapshot or DataFetcher.snapshot(symbol)
+            forecaster = DataFetcher.volatility_forecasts.sync(symbol, period, snapshot.history(period))
+            if forecaster is None:
+                return {"error": f"Not enough data to forecast volatility for {symbol}"}
             
+            horizon_days = max(1, round(horizon_months * TRADING_DAYS / 12))
+            long_run = forecaster.params.long_run_variance
             return {
-                "symbol": symbol,
-                "current_price": round(current_price, 2),
-                "price_change": round(price_change, 2),
-                "price_change_pct": round(price_change_pct, 2),
-                "volatility": round(volatility, 2),
-                "data_points": len(hist),
-                "period": period,
-                "trend": "upward" if price_change > 0 else "downward",
-                "data_quality": "good" if len(hist) > 50 else "limited"
+                "model": DataFetcher.volatility_forecasts.model,
+                "horizon_days": horizon_days,
+                "current_volatility": round(forecaster.forecast(1), 2),
+                "forecast_volatility": round(forecaster.forecast(horizon_days), 2),
+                "long_run_volatility": round(math.sqrt(long_run * TRADING_DAYS) * 100, 2) if long_run else None,
+                "persistence": round(forecaster.params.persistence, 3),
             }
         except Exception as e:
-            return {"error": f"Error fetching market data: {str(e)}"}
+            return {"error": f"Error forecasting volatility: {str(e)}"}
     
     @staticmethod
-    def get_fundamentals(symbol: str) -> Dict:
+    @_timed("get_fundamentals")
+    def get_fundamentals(symbol: str, snapshot: Optional[SymbolSnapshot] = None) -> Dict:
         """
         Fetch fundamental data for a symbol
         
         Args:
             symbol: Stock ticker symbol
+            snapshot: Shared per-query snapshot (a private one is used if omitted)
             
         Returns:
             Dictionary with fundamental metrics
         """
+        if not DataFetcher.universe.contains(symbol):
+            return {"error": f"Unknown symbol: {symbol}"}
+        
         try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
+            snapshot = snapshot or DataFetcher.snapshot(symbol)
+            info = snapshot.info()
             
             # Extract key metrics
             fundamentals = {
@@ -92,61 +710,120 @@ class DataFetcher:
             return {"error": f"Error fetching fundamentals: {str(e)}"}
     
     @staticmethod
-    def get_news(symbol: str, limit: int = 5) -> List[Dict]:
+    @_timed("get_news")
+    def get_news(
+        symbol: str,
+        limit: int = 5,
+        snapshot: Optional[SymbolSnapshot] = None
+    ) -> List[Dict]:
         """
         Fetch recent news for a symbol
         
+        With a news store, articles seen in earlier feeds are kept, so the
+        result can go further back than the current upstream feed.
+        
         Args:
             symbol: Stock ticker symbol
             limit: Maximum number of news items
+            snapshot: Shared per-query snapshot (a private one is used if omitted)
             
         Returns:
             List of news dictionaries
         """
+        if not DataFetcher.universe.contains(symbol):
+            return [{"error": f"Unknown symbol: {symbol}"}]
+        
         try:
-            ticker = yf.Ticker(symbol)
-            news = ticker.news[:limit]
+            snapshot = snapshot or DataFetcher.snapshot(symbol)
+            raw_news = snapshot.news()
             
-            if not news:
-                return []
+            if DataFetcher.news_store is not None:
+                # Only items not seen before are normalized; older stored
+                # items extend the history beyond the current feed
+                items = DataFetcher.news_store.merge(symbol, raw_news)[:limit]
+                return [{field: item[field] for field in _NEWS_FIELDS} for item in items]
             
             news_list = []
-            for item in news:
-                # Handle different news formats from yfinance
-                # New format has content nested
-                if "content" in item and isinstance(item["content"], dict):
-                    content = item["content"]
-                    title = content.get("title", "")
-                    # Try to get publisher from provider
-                    provider = content.get("provider", {})
-                    if isinstance(provider, dict):
-                        publisher = provider.get("displayName", "Unknown")
-                    else:
-                        publisher = "Unknown"
-                    # Get link from canonicalUrl or clickThroughUrl
-                    link = ""
-                    if "canonicalUrl" in content and isinstance(content["canonicalUrl"], dict):
-                        link = content["canonicalUrl"].get("url", "")
-                    elif "clickThroughUrl" in content and isinstance(content["clickThroughUrl"], dict):
-                        link = content["clickThroughUrl"].get("url", "")
-                    published = content.get("pubDate", "")
-                else:
-                    # Old format or direct format
-                    title = item.get("title", "")
-                    publisher = item.get("publisher", item.get("provider", {}).get("displayName", "Unknown") if isinstance(item.get("provider"), dict) else "Unknown")
-                    link = item.get("link", item.get("canonicalUrl", {}).get("url", "") if isinstance(item.get("canonicalUrl"), dict) else "")
-                    published = item.get("providerPublishTime", item.get("pubDate", ""))
-                
-                if title:  # Only add if we have a title
-                    news_list.append({
-                        "title": title,
-                        "publisher": publisher if publisher else "Unknown",
-                        "link": link,
-                        "published": published
-                    })
-            
-            return news_list if news_list else []
+            for item in raw_news[:limit]:
+                normalized = normalize_news_item(item)
+                if normalized:  # Only add if we have a title
+                    news_list.append(normalized)
+            return news_list
         except Exception as e:
             return [{"error": f"Error fetching news: {str(e)}"}]
-
-
+    
+    # ------------------------------------------------------------------
+    # Async API
+    # ------------------------------------------------------------------
+    
+    @classmethod
+    def set_max_concurrency(cls, limit: int) -> None:
+        """
+        Set how many async fetches may be in flight at once
+        
+        Args:
+            limit: Maximum number of concurrent upstream fetches (>= 1)
+        """
+        if limit < 1:
+            raise ValueError("Concurrency limit must be at least 1")
+        old_executor = cls._executor
+        cls.max_concurrency = limit
+        cls._executor = None
+        cls._semaphores = weakref.WeakKeyDictionary()
+        if old_executor is not None:
+            old_executor.shutdown(wait=False)
+    
+    @classmethod
+    async def get_market_data_async(
+        cls,
+        symbol: str,
+        period: str = "1y",
+        snapshot: Optional[SymbolSnapshot] = None
+    ) -> Dict:
+        """Async variant of get_market_data, bounded by max_concurrency"""
+        return await cls._run_bounded(cls.get_market_data, symbol, period, snapshot)
+    
+    @classmethod
+    async def get_fundamentals_async(
+        cls,
+        symbol: str,
+        snapshot: Optional[SymbolSnapshot] = None
+    ) -> Dict:
+        """Async variant of get_fundamentals, bounded by max_concurrency"""
+        return await cls._run_bounded(cls.get_fundamentals, symbol, snapshot)
+    
+    @classmethod
+    async def get_news_async(
+        cls,
+        symbol: str,
+        limit: int = 5,
+        snapshot: Optional[SymbolSnapshot] = None
+    ) -> List[Dict]:
+        """Async variant of get_news, bounded by max_concurrency"""
+        return await cls._run_bounded(cls.get_news, symbol, limit, snapshot)
+    
+    @classmethod
+    async def _run_bounded(cls, func: Callable, *args):
+        """
+        Run a blocking fetch on the worker pool without blocking the event loop
+        
+        The upstream client is synchronous, so each fetch occupies a worker
+        thread; the per-loop semaphore keeps at most max_concurrency of them
+        queued or running for this loop.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = cls._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = cls._semaphores[loop] = asyncio.Semaphore(cls.max_concurrency)
+        
+        async with semaphore:
+            return await loop.run_in_executor(cls._get_executor(), functools.partial(func, *args))
+    
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=cls.max_concurrency,
+                thread_name_prefix="data-fetcher"
+            )
+        return cls._executor
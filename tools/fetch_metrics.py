@@ -0,0 +1,248 @@
+"""
+Fetch Metrics
+Latency histograms, payload sizes, error classes and cache outcomes for data fetches
+"""
+
+import bisect
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+# Upper bounds (milliseconds) of the latency histogram buckets; the last
+# bucket catches everything slower
+DEFAULT_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+def symbol_class(symbol: Any) -> str:
+    """
+    Coarse class of a symbol for grouping metrics
+
+    Args:
+        symbol: Ticker symbol, a list of symbols, or None
+
+    Returns:
+        "equity", "index", "fx", "future", "crypto", "batch" or "none"
+    """
+    if isinstance(symbol, (list, tuple)):
+        return "batch"
+    if not isinstance(symbol, str) or not symbol:
+        return "none"
+    symbol = symbol.upper()
+    if symbol.startswith("^"):
+        return "index"
+    if symbol.endswith("=X"):
+        return "fx"
+    if symbol.endswith("=F"):
+        return "future"
+    if symbol.endswith("-USD"):
+        return "crypto"
+    return "equity"
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with count, sum, min and max"""
+
+    def __init__(self, bounds_ms: Tuple[float, ...] = DEFAULT_BUCKETS_MS):
+        self.bounds_ms = bounds_ms
+        self.counts = [0] * (len(bounds_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = float("inf")
+        self.max_ms = 0.0
+
+    def add(self, ms: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds_ms, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.min_ms = min(self.min_ms, ms)
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th percentile (max for the last bucket)"""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return self.bounds_ms[i] if i < len(self.bounds_ms) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> Dict:
+        labels = [f"<={b:g}" for b in self.bounds_ms] + [f">{self.bounds_ms[-1]:g}"]
+        return {
+            "count": self.count,
+            "mean": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "min": round(self.min_ms, 3) if self.count else 0.0,
+            "max": round(self.max_ms, 3),
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "buckets": {label: n for label, n in zip(labels, self.counts) if n},
+        }
+
+
+class _Stats:
+    def __init__(self, bounds_ms: Tuple[float, ...]):
+        self.latency = LatencyHistogram(bounds_ms)
+        self.rows = 0
+        self.bytes = 0
+        self.errors: Dict[str, int] = {}
+        self.cache: Dict[str, int] = {}
+
+    def to_dict(self) -> Dict:
+        return {
+            "latency_ms": self.latency.to_dict(),
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "errors": dict(self.errors),
+            "cache": dict(self.cache),
+        }
+
+
+class FetchCall:
+    """One timed call; fields set while it runs are recorded when it ends"""
+
+    __slots__ = ("method", "symbol", "rows", "nbytes", "cache", "error")
+
+    def __init__(self, method: str, symbol: Any):
+        self.method = method
+        self.symbol = symbol
+        self.rows: Optional[int] = None
+        self.nbytes: Optional[int] = None
+        self.cache: Optional[str] = None
+        self.error: Optional[str] = None
+
+    def result(self, value: Any) -> None:
+        """
+        Take the row count and any error result from a returned value
+
+        Rows are only counted for sequence payloads (histories, news lists,
+        frames); dict results are single records. Errors are returned as
+        ``{"error": ...}`` or, by get_news, ``[{"error": ...}]``.
+        """
+        if isinstance(value, list) and len(value) == 1 and isinstance(value[0], dict):
+            is_error = "error" in value[0]
+        else:
+            is_error = isinstance(value, dict) and "error" in value
+        if is_error:
+            self.error = self.error or "ErrorResult"
+            self.rows = 0
+            return
+        if isinstance(value, dict):
+            self.rows = None
+            return
+        try:
+            self.rows = len(value)
+        except TypeError:
+            self.rows = None
+
+
+class FetchMetrics:
+    """
+    Thread-safe registry of per-(method, symbol class) fetch statistics.
+
+    Calls are timed with ``timed``; nested timed calls form a per-thread
+    stack so code deeper down (e.g. the cache layer) can annotate the
+    innermost call through ``note_cache``.
+    """
+
+    def __init__(self, bounds_ms: Tuple[float, ...] = DEFAULT_BUCKETS_MS):
+        self.bounds_ms = bounds_ms
+        self._stats: Dict[Tuple[str, str], _Stats] = {}
+        self._since = time.time()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def timed(self, method: str, symbol: Any = None) -> Iterator[FetchCall]:
+        """
+        Time a block and record it under (method, symbol class)
+
+        Exceptions are recorded by class name and re-raised.
+
+        Args:
+            method: Name of the operation, e.g. "load_history"
+            symbol: Symbol (or list of symbols) the call is for
+
+        Yields:
+            FetchCall to annotate with rows, bytes or cache outcome
+        """
+        call = FetchCall(method, symbol)
+        stack = self._stack()
+        stack.append(call)
+        started = time.perf_counter()
+        try:
+            yield call
+        except BaseException as e:
+            call.error = type(e).__name__
+            raise
+        finally:
+            stack.pop()
+            self.record(call, (time.perf_counter() - started) * 1000)
+
+    def note_cache(self, outcome: str) -> None:
+        """Set the cache outcome ("hit", "miss", "stale", ...) of the innermost call"""
+        stack = self._stack()
+        if stack:
+            stack[-1].cache = outcome
+
+    def record(self, call: FetchCall, elapsed_ms: float) -> None:
+        """Add a finished call to the statistics"""
+        key = (call.method, symbol_class(call.symbol))
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = _Stats(self.bounds_ms)
+            stats.latency.add(elapsed_ms)
+            stats.rows += call.rows or 0
+            stats.bytes += call.nbytes or 0
+            if call.error:
+                stats.errors[call.error] = stats.errors.get(call.error, 0) + 1
+            if call.cache:
+                stats.cache[call.cache] = stats.cache.get(call.cache, 0) + 1
+
+    def snapshot(self) -> Dict:
+        """
+        All statistics as plain data
+
+        Returns:
+            {"since": epoch seconds, "calls": {method: {symbol_class: stats}}}
+        """
+        with self._lock:
+            calls: Dict[str, Dict] = {}
+            for (method, klass), stats in sorted(self._stats.items()):
+                calls.setdefault(method, {})[klass] = stats.to_dict()
+            return {"since": self._since, "calls": calls}
+
+    def dump_json(self, path: Optional[str] = None) -> str:
+        """
+        Serialize the snapshot as JSON, optionally writing it to a file
+
+        Args:
+            path: File to write (nothing is written when None)
+
+        Returns:
+            JSON text
+        """
+        text = json.dumps(self.snapshot(), indent=2)
+        if path:
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write(text)
+        return text
+
+    def reset(self) -> None:
+        """Drop all statistics"""
+        with self._lock:
+            self._stats.clear()
+            self._since = time.time()
+
+    def _stack(self) -> List[FetchCall]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
@@ -0,0 +1,84 @@
+"""
+HTTP Session
+Process-wide pooled HTTP session shared by every upstream call
+"""
+
+import os
+import threading
+from typing import Any, Optional
+
+
+DEFAULT_POOL_SIZE = 16
+
+_session: Optional[Any] = None
+_lock = threading.Lock()
+
+
+def pool_size() -> int:
+    """Connections kept alive per host, from ``HTTP_POOL_SIZE`` (default 16)"""
+    try:
+        return max(1, int(os.environ.get("HTTP_POOL_SIZE", DEFAULT_POOL_SIZE)))
+    except ValueError:
+        return DEFAULT_POOL_SIZE
+
+
+def _curl_session(size: int):
+    from curl_cffi import CurlOpt
+    from curl_cffi import requests as curl_requests
+
+    # Same browser impersonation yfinance uses for its own default session.
+    # curl_cffi keeps one curl handle per thread; MAXCONNECTS bounds the
+    # idle keep-alive connections each handle holds on to.
+    return curl_requests.Session(impersonate="chrome", curl_options={CurlOpt.MAXCONNECTS: size})
+
+
+def _requests_session(size: int):
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=size, pool_maxsize=size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def new_session(size: Optional[int] = None):
+    """
+    Build a pooled keep-alive session
+
+    Uses curl_cffi like yfinance does, falling back to requests when
+    curl_cffi is missing or ``YF_DISABLE_CURL_CFFI`` is set.
+
+    Args:
+        size: Pool size (defaults to ``pool_size()``)
+
+    Returns:
+        curl_cffi or requests Session
+    """
+    size = size or pool_size()
+    if not os.environ.get("YF_DISABLE_CURL_CFFI"):
+        try:
+            return _curl_session(size)
+        except ImportError:
+            pass
+    return _requests_session(size)
+
+
+def get_session():
+    """Shared session for the whole process, created on first use"""
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = new_session()
+    return _session
+
+
+def reset_session() -> None:
+    """Close the shared session so the next call builds a fresh one"""
+    global _session
+    with _lock:
+        session, _session = _session, None
+    if session is not None:
+        session.close()
@@ -0,0 +1,269 @@
+"""
+Market Data Providers
+Upstream sources behind DataFetcher: live yfinance plus record/replay fixtures
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+import yfinance as yf
+
+from tools.http_session import get_session
+from tools.price_store import PERIOD_DAYS, PriceStore
+
+
+# Fields a lightweight quote can carry
+QUOTE_FIELDS = ("last_price", "previous_close", "market_cap")
+
+
+class MarketDataProvider:
+    """
+    Interface for an upstream market data source.
+
+    Subclasses return raw data in yfinance shapes: an OHLCV DataFrame with a
+    tz-aware index for history, the ``info`` dict and the ``news`` list.
+    """
+
+    def history(
+        self,
+        symbol: str,
+        period: Optional[str] = None,
+        start: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Price history for a period, or from a start date (YYYY-MM-DD) to now
+
+        Args:
+            symbol: Stock ticker symbol
+            period: Time period (6mo, 1y, 2y, etc.)
+            start: Start date, used instead of period when given
+
+        Returns:
+            OHLCV DataFrame (may be empty)
+        """
+        raise NotImplementedError
+
+    def info(self, symbol: str) -> Dict:
+        """Company info payload for a symbol"""
+        raise NotImplementedError
+
+    def news(self, symbol: str) -> List[Dict]:
+        """Raw news items for a symbol"""
+        raise NotImplementedError
+
+    def quote(self, symbol: str, fields: Tuple[str, ...] = QUOTE_FIELDS) -> Dict[str, Optional[float]]:
+        """
+        Lightweight quote with only the requested fields
+
+        The default derives prices from a few days of history and the market
+        cap from ``info``, so fixture providers need nothing extra.
+
+        Args:
+            symbol: Stock ticker symbol
+            fields: Subset of QUOTE_FIELDS to return
+
+        Returns:
+            Dict with one entry per requested field (None when unavailable)
+        """
+        quote: Dict[str, Optional[float]] = {}
+        if "last_price" in fields or "previous_close" in fields:
+            closes = self.history(symbol, period="5d")["Close"].dropna()
+            if "last_price" in fields:
+                quote["last_price"] = float(closes.iloc[-1]) if len(closes) else None
+            if "previous_close" in fields:
+                quote["previous_close"] = float(closes.iloc[-2]) if len(closes) >= 2 else None
+        if "market_cap" in fields:
+            quote["market_cap"] = self.info(symbol).get("marketCap")
+        return quote
+
+    def closes(self, symbols: List[str], period: str) -> pd.DataFrame:
+        """
+        Close prices for many symbols as a date-by-symbol matrix
+
+        Args:
+            symbols: Stock ticker symbols
+            period: Time period (6mo, 1y, 2y, etc.)
+
+        Returns:
+            DataFrame with one column per symbol (missing symbols may be absent)
+        """
+        frames = {}
+        for symbol in symbols:
+            hist = self.history(symbol, period=period)
+            if not hist.empty:
+                frames[symbol] = hist["Close"]
+        return pd.DataFrame(frames)
+
+    @staticmethod
+    def from_env() -> "MarketDataProvider":
+        """
+        Provider selected by environment variables
+
+        ``MARKET_DATA_REPLAY_DIR`` serves everything from fixtures,
+        ``MARKET_DATA_RECORD_DIR`` fetches live and records fixtures,
+        otherwise live yfinance is used.
+        """
+        replay_dir = os.environ.get("MARKET_DATA_REPLAY_DIR")
+        if replay_dir:
+            return ReplayProvider(replay_dir)
+        record_dir = os.environ.get("MARKET_DATA_RECORD_DIR")
+        if record_dir:
+            return RecordingProvider(YFinanceProvider(), record_dir)
+        return YFinanceProvider()
+
+
+class YFinanceProvider(MarketDataProvider):
+    """Live data from Yahoo Finance via yfinance, over the shared pooled session"""
+
+    def _ticker(self, symbol: str) -> yf.Ticker:
+        return yf.Ticker(symbol, session=get_session())
+
+    def history(self, symbol, period=None, start=None):
+        ticker = self._ticker(symbol)
+        if start is not None:
+            return ticker.history(start=start)
+        return ticker.history(period=period or "1y")
+
+    def info(self, symbol):
+        return self._ticker(symbol).info or {}
+
+    def news(self, symbol):
+        return self._ticker(symbol).news or []
+
+    def quote(self, symbol, fields=QUOTE_FIELDS):
+        # fast_info loads lazily per attribute: the last price needs one chart
+        # request, the market cap adds the share count, and neither needs the
+        # full quoteSummary payload behind ``info``
+        fast_info = self._ticker(symbol).fast_info
+        quote = {}
+        for field in fields:
+            value = getattr(fast_info, field, None)
+            quote[field] = float(value) if value is not None and value == value else None
+        return quote
+
+    def closes(self, symbols, period):
+        data = yf.download(
+            symbols,
+            period=period,
+            group_by="column",
+            auto_adjust=True,
+            threads=True,
+            progress=False,
+            session=get_session()
+        )
+        if data is None or data.empty or "Close" not in data:
+            return pd.DataFrame()
+        closes = data["Close"]
+        if isinstance(closes, pd.Series):
+            closes = closes.to_frame(symbols[0])
+        return closes
+
+
+class ReplayProvider(MarketDataProvider):
+    """
+    Serves recorded fixtures from a local directory without any network access.
+
+    Fixtures are loaded into memory on first use. Period requests are sliced
+    relative to the last recorded bar, so results do not drift with the
+    wall clock.
+
+    Layout::
+
+        <root>/history/<SYMBOL>.npz   (PriceStore format)
+        <root>/info/<SYMBOL>.json
+        <root>/news/<SYMBOL>.json
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root).expanduser()
+        self._prices = PriceStore(self.root / "history")
+        self._history: Dict[str, pd.DataFrame] = {}
+        self._info: Dict[str, Dict] = {}
+        self._news: Dict[str, List[Dict]] = {}
+
+    def history(self, symbol, period=None, start=None):
+        symbol = symbol.upper()
+        if symbol not in self._history:
+            stored = self._prices.load(symbol)
+            self._history[symbol] = stored[0] if stored else pd.DataFrame(columns=PriceStore.COLUMNS)
+
+        hist = self._history[symbol]
+        if hist.empty:
+            return hist
+        if start is not None:
+            return hist[hist.index >= pd.Timestamp(start).tz_localize(hist.index.tz)]
+        days = PERIOD_DAYS.get(period or "1y")
+        if days is None:
+            return hist
+        cutoff = hist.index[-1].normalize() - pd.Timedelta(days=days)
+        return hist[hist.index > cutoff]
+
+    def info(self, symbol):
+        symbol = symbol.upper()
+        if symbol not in self._info:
+            self._info[symbol] = self._load_json("info", symbol, {})
+        return self._info[symbol]
+
+    def news(self, symbol):
+        symbol = symbol.upper()
+        if symbol not in self._news:
+            self._news[symbol] = self._load_json("news", symbol, [])
+        return self._news[symbol]
+
+    def _load_json(self, kind: str, symbol: str, default):
+        path = self.root / kind / f"{symbol}.json"
+        if not path.exists():
+            return default
+        with open(path, encoding="utf-8") as handle:
+            return json.load(handle)
+
+
+class RecordingProvider(MarketDataProvider):
+    """
+    Wraps another provider and records everything it returns as fixtures
+    that ReplayProvider can serve later.
+    """
+
+    def __init__(self, inner: MarketDataProvider, root: str):
+        self.inner = inner
+        self.root = Path(root).expanduser()
+        self._prices = PriceStore(self.root / "history")
+
+    def history(self, symbol, period=None, start=None):
+        hist = self.inner.history(symbol, period=period, start=start)
+        if not hist.empty:
+            self._record_history(symbol, hist)
+        return hist
+
+    def info(self, symbol):
+        info = self.inner.info(symbol)
+        self._write_json("info", symbol, info)
+        return info
+
+    def news(self, symbol):
+        news = self.inner.news(symbol)
+        self._write_json("news", symbol, news)
+        return news
+
+    def closes(self, symbols, period):
+        # Go through history() so every symbol is recorded
+        return MarketDataProvider.closes(self, symbols, period)
+
+    def _record_history(self, symbol: str, hist: pd.DataFrame) -> None:
+        """Merge new bars into the recorded history, keeping the longest window"""
+        hist = hist[list(PriceStore.COLUMNS)]
+        stored = self._prices.load(symbol)
+        if stored is not None:
+            old = stored[0]
+            hist = hist.tz_convert(old.index.tz)
+            hist = pd.concat([old[~old.index.isin(hist.index)], hist]).sort_index()
+        self._prices.save(symbol, hist, hist.index[0])
+
+    def _write_json(self, kind: str, symbol: str, payload) -> None:
+        path = self.root / kind / f"{symbol.upper()}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, default=str)
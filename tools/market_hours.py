@@ -0,0 +1,56 @@
+"""
+Market Hours
+Regular-session schedule for US equity exchanges (NYSE/Nasdaq)
+"""
+
+from datetime import datetime, time, timedelta
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+
+EXCHANGE_TZ = ZoneInfo("America/New_York")
+SESSION_OPEN = time(9, 30)
+SESSION_CLOSE = time(16, 0)
+
+
+def _exchange_now(now: Optional[datetime]) -> datetime:
+    if now is None:
+        return datetime.now(EXCHANGE_TZ)
+    if now.tzinfo is None:
+        raise ValueError("now must be timezone-aware")
+    return now.astimezone(EXCHANGE_TZ)
+
+
+def is_market_open(now: Optional[datetime] = None) -> bool:
+    """
+    Whether the regular session is open
+
+    Exchange holidays are not modelled, so a holiday weekday counts as open.
+
+    Args:
+        now: Timezone-aware time to check (defaults to the current time)
+
+    Returns:
+        True between 09:30 and 16:00 New York time on weekdays
+    """
+    now = _exchange_now(now)
+    return now.weekday() < 5 and SESSION_OPEN <= now.time() < SESSION_CLOSE
+
+
+def next_market_open(now: Optional[datetime] = None) -> datetime:
+    """
+    Start of the next regular session strictly after now
+
+    Args:
+        now: Timezone-aware reference time (defaults to the current time)
+
+    Returns:
+        Timezone-aware datetime of the next 09:30 New York open
+    """
+    now = _exchange_now(now)
+    candidate = datetime.combine(now.date(), SESSION_OPEN, tzinfo=EXCHANGE_TZ)
+    if candidate <= now:
+        candidate += timedelta(days=1)
+    while candidate.weekday() >= 5:
+        candidate += timedelta(days=1)
+    return candidate
@@ -0,0 +1,190 @@
+"""
+News Store
+Incremental per-symbol news history, deduplicated by canonical link
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from tools.cache_files import atomic_write, cache_dir
+
+
+def _canonical_link(item: Dict) -> str:
+    """Link identifying a raw news item in either yfinance format"""
+    content = item.get("content")
+    source = content if isinstance(content, dict) else item
+    for field in ("canonicalUrl", "clickThroughUrl"):
+        url = source.get(field)
+        if isinstance(url, dict) and url.get("url"):
+            return url["url"]
+    return source.get("link") or ""
+
+
+def _item_key(item: Dict) -> str:
+    """Dedup key for a raw item: its link, else its id or title"""
+    link = _canonical_link(item)
+    if link:
+        return link
+    content = item.get("content")
+    source = content if isinstance(content, dict) else item
+    return str(item.get("id") or item.get("uuid") or source.get("title") or "")
+
+
+def _published_ts(value: Any) -> float:
+    """Epoch seconds for an epoch number or an ISO date string (0 if unknown)"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if value:
+        try:
+            return pd.Timestamp(value).timestamp()
+        except (ValueError, TypeError):
+            pass
+    return 0.0
+
+
+def normalize_news_item(item: Dict) -> Optional[Dict]:
+    """
+    Flatten a raw yfinance news item into title/publisher/link/published
+
+    Args:
+        item: Raw item in the nested ``content`` format or the older flat format
+
+    Returns:
+        Normalized item, or None if it has no title
+    """
+    # New format has content nested
+    if "content" in item and isinstance(item["content"], dict):
+        content = item["content"]
+        title = content.get("title", "")
+        provider = content.get("provider", {})
+        publisher = provider.get("displayName", "Unknown") if isinstance(provider, dict) else "Unknown"
+        published = content.get("pubDate", "")
+    else:
+        # Old format or direct format
+        title = item.get("title", "")
+        provider = item.get("provider")
+        publisher = item.get("publisher", provider.get("displayName", "Unknown") if isinstance(provider, dict) else "Unknown")
+        published = item.get("providerPublishTime", item.get("pubDate", ""))
+
+    if not title:
+        return None
+    return {
+        "title": title,
+        "publisher": publisher if publisher else "Unknown",
+        "link": _canonical_link(item),
+        "published": published
+    }
+
+
+class NewsStore:
+    """
+    Per-symbol news history that grows as new articles appear.
+
+    Items are kept newest first, keyed by canonical link. Merging a fresh
+    upstream feed only looks up each item's link, so only articles that are
+    actually new get normalized. Each symbol is persisted as one JSON file;
+    at most ``max_symbols`` symbols stay loaded in memory and the least
+    recently used ones are read back from disk when needed again.
+    """
+
+    def __init__(self, root: Optional[str] = None, max_items: int = 200, max_symbols: int = 1024):
+        self.root = Path(root).expanduser() if root else None
+        self.max_items = max_items
+        self.max_symbols = max_symbols
+        self._symbols: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default(cls) -> "NewsStore":
+        """Store under ``NEWS_STORE_DIR`` or ``.cache/news`` in the project root"""
+        return cls(cache_dir("NEWS_STORE_DIR", "news"))
+
+    def merge(self, symbol: str, raw_items: List[Dict]) -> List[Dict]:
+        """
+        Add new items from an upstream feed and return the full history
+
+        Args:
+            symbol: Stock ticker symbol
+            raw_items: Raw yfinance news items, in any order
+
+        Returns:
+            Normalized items, newest first
+        """
+        symbol = symbol.upper()
+        with self._lock:
+            state = self._state(symbol)
+            known = {item["key"] for item in state["items"]}
+            added = []
+            for raw in raw_items or []:
+                key = _item_key(raw)
+                if key in known:
+                    continue
+                item = normalize_news_item(raw)
+                if item is None:
+                    continue
+                item["key"] = key
+                item["published_ts"] = _published_ts(item["published"])
+                known.add(key)
+                added.append(item)
+
+            if added:
+                items = sorted(added + state["items"], key=lambda i: i["published_ts"], reverse=True)
+                state["items"] = items[:self.max_items]
+                self._save_quietly(symbol, state)
+            return state["items"]
+
+    def items(self, symbol: str, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Stored items for a symbol without contacting the upstream
+
+        Args:
+            symbol: Stock ticker symbol
+            limit: Maximum number of items (all when None)
+
+        Returns:
+            Normalized items, newest first
+        """
+        with self._lock:
+            items = self._state(symbol.upper())["items"]
+        return items[:limit] if limit is not None else list(items)
+
+    def _state(self, symbol: str) -> Dict:
+        state = self._symbols.get(symbol)
+        if state is None:
+            state = self._load(symbol) or {"items": []}
+            self._symbols[symbol] = state
+            while len(self._symbols) > self.max_symbols:
+                self._symbols.popitem(last=False)
+        self._symbols.move_to_end(symbol)
+        return state
+
+    def _load(self, symbol: str) -> Optional[Dict]:
+        if self.root is None:
+            return None
+        path = self._path(symbol)
+        try:
+            with open(path, encoding="utf-8") as handle:
+                state = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(state, dict) or not isinstance(state.get("items"), list):
+            return None
+        return {"items": state["items"]}
+
+    def _save_quietly(self, symbol: str, state: Dict) -> None:
+        """Atomically persist one symbol, ignoring disk errors"""
+        if self.root is None:
+            return
+        try:
+            with atomic_write(self._path(symbol), "w", encoding="utf-8") as handle:
+                json.dump(state, handle, default=str)
+        except OSError:
+            pass
+
+    def _path(self, symbol: str) -> Path:
+        return self.root / f"{symbol.replace('/', '_')}.json"
@@ -0,0 +1,118 @@
+"""
+Prewarm
+Fills the history, fundamentals and news caches for a watchlist before serving traffic
+
+Usage:
+    python3 -m tools.prewarm watchlist.txt
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional
+
+from tools.data_fetcher import DataFetcher
+
+
+def load_watchlist(path: str) -> List[str]:
+    """
+    Read symbols from a watchlist file
+
+    One or more symbols per line, separated by commas or whitespace;
+    anything after '#' is a comment.
+
+    Args:
+        path: Watchlist file path
+
+    Returns:
+        Unique upper-case symbols in file order
+    """
+    symbols = []
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            line = line.split("#", 1)[0]
+            symbols.extend(s.upper() for s in line.replace(",", " ").split())
+    return list(dict.fromkeys(symbols))
+
+
+def _warm_symbol(symbol: str, period: str) -> None:
+    DataFetcher.load_history(symbol, period)
+    DataFetcher.load_info(symbol)
+    DataFetcher.load_news(symbol)
+
+
+def prewarm(
+    symbols: List[str],
+    period: str = "2y",
+    max_workers: int = 8,
+    progress: Optional[Callable[[str], None]] = print
+) -> Dict:
+    """
+    Load history, info and news for every symbol in parallel
+
+    The default period is the longest one MarketDataAgent uses, so shorter
+    horizons are served by slicing the cached window.
+
+    Args:
+        symbols: Symbols to warm
+        period: History period to load
+        max_workers: Number of symbols warmed concurrently
+        progress: Called with one line per finished symbol (None for silence)
+
+    Returns:
+        Report with counts, per-symbol timings, failures and total time
+    """
+    report = {"symbols": len(symbols), "warmed": 0, "timings_ms": {}, "failed": {}}
+    started = time.perf_counter()
+
+    def run(symbol: str):
+        t0 = time.perf_counter()
+        if not DataFetcher.universe.contains(symbol):
+            raise ValueError(f"Unknown symbol: {symbol}")
+        _warm_symbol(symbol, period)
+        return (time.perf_counter() - t0) * 1000
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="prewarm") as pool:
+        futures = {pool.submit(run, symbol): symbol for symbol in symbols}
+        for done, future in enumerate(as_completed(futures), 1):
+            symbol = futures[future]
+            try:
+                elapsed_ms = future.result()
+                report["warmed"] += 1
+                report["timings_ms"][symbol] = round(elapsed_ms, 1)
+                status = f"{elapsed_ms:.0f} ms"
+            except Exception as e:
+                report["failed"][symbol] = str(e)
+                status = f"failed: {e}"
+            if progress:
+                progress(f"[{done}/{len(symbols)}] {symbol} {status}")
+
+    report["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+    if progress:
+        progress(
+            f"Prewarmed {report['warmed']}/{report['symbols']} symbols "
+            f"in {report['elapsed_seconds']:.2f}s"
+        )
+    return report
+
+
+def prewarm_from_env(progress: Optional[Callable[[str], None]] = print) -> Optional[Dict]:
+    """
+    Prewarm the watchlist named by ``PREWARM_WATCHLIST``, if set
+
+    Returns:
+        Prewarm report, or None when no watchlist is configured
+    """
+    path = os.environ.get("PREWARM_WATCHLIST")
+    if not path:
+        return None
+    return prewarm(load_watchlist(path), progress=progress)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print(__doc__.strip())
+        sys.exit(2)
+    result = prewarm(load_watchlist(sys.argv[1]))
+    sys.exit(1 if result["failed"] else 0)
@@ -0,0 +1,145 @@
+"""
+Price History
+Compact typed-array representation of a symbol's daily price history
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from tools.price_store import PERIOD_DAYS
+
+
+_EPOCH = np.datetime64("1970-01-01", "D")
+
+
+class PriceHistory:
+    """
+    Daily closes (and optionally volume) for one symbol as NumPy arrays.
+
+    Dates are exchange-local calendar days stored as int32 days since
+    1970-01-01. A DataFrame is only built when a caller asks for one via
+    ``to_frame``, so resident histories cost 12-20 bytes per bar instead of
+    a full OHLCV frame with a tz-aware index.
+    """
+
+    __slots__ = ("dates", "closes", "volume", "tz")
+
+    def __init__(
+        self,
+        dates: np.ndarray,
+        closes: np.ndarray,
+        volume: Optional[np.ndarray] = None,
+        tz: Optional[str] = None
+    ):
+        self.dates = dates
+        self.closes = closes
+        self.volume = volume
+        self.tz = tz
+
+    @classmethod
+    def empty(cls) -> "PriceHistory":
+        return cls(np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float64))
+
+    @classmethod
+    def from_frame(
+        cls,
+        frame: pd.DataFrame,
+        close_dtype=np.float64,
+        keep_volume: bool = True
+    ) -> "PriceHistory":
+        """
+        Build from an OHLCV DataFrame (as returned by ``ticker.history``)
+
+        Args:
+            frame: DataFrame with a Close column and a DatetimeIndex
+            close_dtype: np.float64 (default) or np.float32 to halve memory
+            keep_volume: Whether to keep the Volume column
+
+        Returns:
+            PriceHistory with its own compact arrays
+        """
+        if frame is None or frame.empty:
+            return cls.empty()
+
+        index = frame.index
+        tz = str(index.tz) if index.tz is not None else None
+        if tz is not None:
+            index = index.tz_localize(None)
+        days = index.normalize().to_numpy().astype("datetime64[D]")
+        dates = (days - _EPOCH).astype(np.int32)
+
+        closes = frame["Close"].to_numpy(dtype=close_dtype)
+        volume = None
+        if keep_volume and "Volume" in frame:
+            volume = frame["Volume"].to_numpy(dtype=np.float64)
+        return cls(dates, closes, volume, tz)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        DataFrame view of the history (Close and, if kept, Volume)
+
+        Returns:
+            DataFrame indexed by exchange-local dates (tz-aware when known)
+        """
+        index = pd.DatetimeIndex((_EPOCH + self.dates).astype("datetime64[ns]"), name="Date")
+        if self.tz is not None:
+            index = index.tz_localize(self.tz)
+        data = {"Close": self.closes}
+        if self.volume is not None:
+            data["Volume"] = self.volume
+        return pd.DataFrame(data, index=index)
+
+    def slice_to_period(self, period: str) -> "PriceHistory":
+        """
+        Trailing bars inside a period ending at the last bar, as views on the same arrays
+
+        The period is measured back from the newest bar rather than today,
+        like ReplayProvider does, so a 6mo slice of an older (e.g. replayed)
+        2y history is the same as fetching 6mo directly.
+
+        Args:
+            period: Time period (6mo, 1y, 2y, etc.)
+
+        Returns:
+            PriceHistory sharing memory with this one
+        """
+        if period not in PERIOD_DAYS or len(self) == 0:
+            return self
+        cutoff_day = int(self.dates[-1]) - PERIOD_DAYS[period]
+        return self[int(np.searchsorted(self.dates, cutoff_day, side="right")):]
+
+    def close_on(self, day: int) -> Optional[float]:
+        """
+        Close of the bar on an epoch day
+
+        Args:
+            day: Days since 1970-01-01
+
+        Returns:
+            Close, or None if there is no bar on that day
+        """
+        i = int(np.searchsorted(self.dates, day))
+        if i < len(self.dates) and int(self.dates[i]) == day:
+            return float(self.closes[i])
+        return None
+
+    def date_str(self, position: int) -> str:
+        """Calendar date of a bar as YYYY-MM-DD"""
+        return str(_EPOCH + int(self.dates[position]))
+
+    @property
+    def nbytes(self) -> int:
+        return self.dates.nbytes + self.closes.nbytes + (self.volume.nbytes if self.volume is not None else 0)
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self.dates) == 0
+
+    def __getitem__(self, key: slice) -> "PriceHistory":
+        volume = self.volume[key] if self.volume is not None else None
+        return PriceHistory(self.dates[key], self.closes[key], volume, self.tz)
+
+    def __len__(self) -> int:
+        return len(self.dates)
@@ -0,0 +1,199 @@
+"""
+Price Store
+Persistent on-disk OHLCV cache that only fetches bars newer than the last stored one
+"""
+
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from tools.cache_files import atomic_write, cache_dir
+
+
+# Calendar days covered by each yfinance period string
+PERIOD_DAYS = {
+    "1d": 1,
+    "5d": 7,
+    "1mo": 31,
+    "3mo": 92,
+    "6mo": 183,
+    "1y": 366,
+    "2y": 731,
+    "5y": 1827,
+    "10y": 3653,
+}
+
+
+def period_cutoff(period: str) -> Optional[pd.Timestamp]:
+    """
+    Earliest timestamp (UTC midnight) inside a period ending today
+
+    Args:
+        period: Time period (6mo, 1y, 2y, etc.)
+
+    Returns:
+        Cutoff timestamp, or None for periods without a fixed length (e.g. max)
+    """
+    if period not in PERIOD_DAYS:
+        return None
+    return pd.Timestamp.now(tz="UTC").normalize() - pd.Timedelta(days=PERIOD_DAYS[period])
+
+
+def slice_to_period(hist: pd.DataFrame, period: str) -> pd.DataFrame:
+    """
+    Trailing part of a longer history that falls inside a period
+
+    Uses a positional slice on the sorted index, so no bars are copied.
+
+    Args:
+        hist: OHLCV DataFrame sorted by a tz-aware index
+        period: Time period (6mo, 1y, 2y, etc.)
+
+    Returns:
+        View of hist starting at the period cutoff
+    """
+    cutoff = period_cutoff(period)
+    if cutoff is None or hist.empty:
+        return hist
+    return hist.iloc[hist.index.searchsorted(cutoff):]
+
+
+class PriceStore:
+    """
+    Columnar per-symbol price history kept on disk.
+
+    Each symbol is one uncompressed ``.npz`` file holding the bar timestamps
+    and one array per OHLCV column, plus the start date the stored history is
+    known to cover. A request for a period that is already covered only
+    downloads bars from the last stored date onwards and appends them.
+    """
+
+    COLUMNS = ("Open", "High", "Low", "Close", "Volume")
+
+    def __init__(self, root: str):
+        self.root = Path(root).expanduser()
+
+    @classmethod
+    def default(cls) -> "PriceStore":
+        """Store under ``PRICE_STORE_DIR`` or ``.cache/prices`` in the project root"""
+        return cls(cache_dir("PRICE_STORE_DIR", "prices"))
+
+    def history(self, symbol: str, period: str, provider) -> pd.DataFrame:
+        """
+        Price history for a period, served from disk plus a delta fetch
+
+        Args:
+            symbol: Stock ticker symbol
+            period: Time period (6mo, 1y, 2y, etc.)
+            provider: MarketDataProvider used for any upstream fetch
+
+        Returns:
+            OHLCV DataFrame covering the period (may be empty)
+        """
+        cutoff = period_cutoff(period)
+        if cutoff is None:
+            return provider.history(symbol, period=period)
+
+        try:
+            stored = self.load(symbol)
+        except (OSError, ValueError, KeyError):
+            stored = None
+
+        if stored is None or stored[1] > cutoff:
+            hist = provider.history(symbol, period=period)
+            if not hist.empty:
+                self._save_quietly(symbol, hist, cutoff)
+            return hist
+
+        hist, covered_from = stored
+        # Re-fetch from the last complete stored bar: the last one may have
+        # been a partial session, and the one before it anchors the check
+        # that the stored bars still match upstream's adjustment
+        anchor = hist.index[-2] if len(hist) > 1 else hist.index[-1]
+        delta = provider.history(symbol, start=anchor.strftime("%Y-%m-%d"))
+        if not delta.empty:
+            delta = delta.tz_convert(hist.index.tz)
+            if self._readjusted(hist, delta, anchor):
+                # A split or dividend rescaled the whole series upstream
+                hist = provider.history(symbol, start=covered_from.strftime("%Y-%m-%d"))
+                if hist.empty:
+                    return hist
+                self._save_quietly(symbol, hist, covered_from)
+                return slice_to_period(hist, period)
+            delta = delta[list(self.COLUMNS)]
+            hist = pd.concat([hist[hist.index < delta.index[0]], delta])
+            self._save_quietly(symbol, hist, covered_from)
+
+        return slice_to_period(hist, period)
+
+    @staticmethod
+    def _readjusted(hist: pd.DataFrame, delta: pd.DataFrame, anchor: pd.Timestamp) -> bool:
+        """
+        Whether upstream re-adjusted prices the stored bars were saved with
+
+        yfinance back-adjusts the whole history for splits and dividends, so
+        the stored bars go stale when the anchor bar's close no longer
+        matches, or when a corporate action falls on a bar not stored yet.
+        """
+        if anchor not in delta.index:
+            return True
+        if not np.isclose(delta.at[anchor, "Close"], hist.at[anchor, "Close"], rtol=1e-5):
+            return True
+        newer = delta.index > hist.index[-1]
+        for column in ("Dividends", "Stock Splits"):
+            if column in delta and (delta.loc[newer, column].fillna(0) != 0).any():
+                return True
+        return False
+
+    def load(self, symbol: str) -> Optional[Tuple[pd.DataFrame, pd.Timestamp]]:
+        """
+        Load the stored history for a symbol
+
+        Args:
+            symbol: Stock ticker symbol
+
+        Returns:
+            Tuple of (OHLCV DataFrame, covered-from timestamp), or None if not stored
+        """
+        path = self._path(symbol)
+        if not path.exists():
+            return None
+
+        with np.load(path, allow_pickle=False) as data:
+            index = pd.DatetimeIndex(pd.to_datetime(data["index"], utc=True))
+            index = index.tz_convert(str(data["tz"])).rename("Date")
+            frame = pd.DataFrame({col: data[col] for col in self.COLUMNS}, index=index)
+            covered_from = pd.Timestamp(int(data["covered_from"]), tz="UTC")
+
+        if frame.empty:
+            return None
+        return frame, covered_from
+
+    def save(self, symbol: str, hist: pd.DataFrame, covered_from: pd.Timestamp) -> None:
+        """
+        Atomically write the history for a symbol
+
+        Args:
+            symbol: Stock ticker symbol
+            hist: OHLCV DataFrame with a tz-aware index
+            covered_from: Earliest date the history is known to cover
+        """
+        arrays = {col: hist[col].to_numpy(dtype="float64") for col in self.COLUMNS}
+        arrays["index"] = hist.index.tz_convert("UTC").as_unit("ns").asi8
+        arrays["tz"] = np.array(str(hist.index.tz))
+        arrays["covered_from"] = np.array(pd.Timestamp(covered_from).as_unit("ns").value)
+
+        with atomic_write(self._path(symbol)) as handle:
+            np.savez(handle, **arrays)
+
+    def _save_quietly(self, symbol: str, hist: pd.DataFrame, covered_from: pd.Timestamp) -> None:
+        """Persist history, ignoring disk errors (the fetched data is still usable)"""
+        try:
+            self.save(symbol, hist, covered_from)
+        except (OSError, KeyError):
+            pass
+
+    def _path(self, symbol: str) -> Path:
+        return self.root / f"{symbol.upper().replace('/', '_')}.npz"
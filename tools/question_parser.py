@@ -6,6 +6,21 @@ Identifies question type and extracts parameters from natural language questions
 import re
 from typing import Dict, Optional, Tuple
 
+from tools.data_fetcher import DataFetcher
+
+
+# Everyday words that are also (normalized) company names, e.g. "best" for
+# Best Inc; never read as company names in free-form questions
+_COMMON_WORDS = frozenset("""
+    about after again all also and any are article back bad best better big buy buying can company
+    compare could day does doing down earnings end for from fund get give going good great growth
+    has have high hold how into invest investing investment its just know like long look looking low
+    make market money month months more most much new news next not now one only other our out over
+    price profit right risk risky safe sell share shares short should some stock stocks than that
+    the their then there these they think this time today top trade trading tell up value want was
+    way well what when where which who why will with worth would year years yesterday you your
+""".split())
+
 
 class QuestionParser:
     """Parses natural language questions and extracts relevant parameters"""
@@ -73,7 +88,7 @@ class QuestionParser:
             for pattern in patterns:
                 match = re.search(pattern, question_lower)
                 if match:
-                    symbol = match.group(1).upper()
+                    symbol = QuestionParser._resolve_symbol(match.group(1))
                     return {
                         "type": "simple",
                         "subtype": q_type,
@@ -93,7 +108,10 @@ class QuestionParser:
                             return {
                                 "type": "complex",
                                 "subtype": q_type,
-                                "symbols": [symbols_match.group(1).upper(), symbols_match.group(2).upper()],
+                                "symbols": [
+                                    QuestionParser._resolve_symbol(symbols_match.group(1)),
+                                    QuestionParser._resolve_symbol(symbols_match.group(2))
+                                ],
                                 "original_question": question
                             }
                     elif q_type == "portfolio":
@@ -115,8 +133,7 @@ class QuestionParser:
                         }
                     elif q_type == "investment_recommendation":
                         # Extract symbol and horizon
-                        symbol_match = re.search(r"(\w+)", question_lower)
-                        symbol = symbol_match.group(1).upper() if symbol_match else None
+                        symbol = QuestionParser._resolve_symbol(match.group(1))
                         # Extract horizon
                         horizon_match = re.search(r"(\d+)\s*(?:month|months|year|years)", question_lower)
                         horizon = int(horizon_match.group(1)) if horizon_match else 12
@@ -139,7 +156,7 @@ class QuestionParser:
                     elif q_type == "data_based_recommendation":
                         # Extract symbol if mentioned
                         symbol_match = re.search(r"for (\w+)", question_lower)
-                        symbol = symbol_match.group(1).upper() if symbol_match else None
+                        symbol = QuestionParser._resolve_symbol(symbol_match.group(1)) if symbol_match else None
                         return {
                             "type": "complex",
                             "subtype": q_type,
@@ -149,8 +166,7 @@ class QuestionParser:
         
         # Default: treat as complex investment question
         # Try to extract symbol
-        symbol_match = re.search(r"\b([A-Z]{2,5})\b", question.upper())
-        symbol = symbol_match.group(1) if symbol_match else None
+        symbol = QuestionParser._find_symbol(question)
         
         return {
             "type": "complex",
@@ -160,4 +176,56 @@ class QuestionParser:
             "risk_profile": "moderate",
             "original_question": question
         }
-
+    
+    @staticmethod
+    def _resolve_symbol(word: str) -> Optional[str]:
+        """
+        Map a captured word to a listed ticker or a company name's ticker
+        
+        Patterns match the lowercased question, so a capture such as "good"
+        in "how much is good" cannot be told apart from a ticker by case;
+        common English words are never resolved, neither as tickers nor as
+        the first word of a company name (Good Times Restaurants).
+        
+        Args:
+            word: Word captured by a question pattern
+            
+        Returns:
+            Ticker symbol, or None if the word is not a known symbol
+        """
+        if not word or word.lower() in _COMMON_WORDS:
+            return None
+        return DataFetcher.universe.resolve(word)
+    
+    @staticmethod
+    def _find_symbol(question: str) -> Optional[str]:
+        """
+        Find a symbol anywhere in a free-form question
+        
+        Tickers written in capitals ("Is NVDA a buy?") are tried first, then
+        company names ("thoughts on microsoft"). Words that are neither, such
+        as "WHAT" or "GOOD", are never returned as symbols when the ticker
+        universe is loaded. Single capitals ("A friend says...") are skipped,
+        as they start sentences far more often than they name a ticker.
+        Lowercase words must match a full company name and must not be
+        common English words ("good", "best").
+        
+        Args:
+            question: Natural language question string
+            
+        Returns:
+            Ticker symbol, or None if none was found
+        """
+        universe = DataFetcher.universe
+        for token in re.findall(r"\b[A-Z]{2,5}\b", question):
+            if universe.contains(token):
+                return token
+        
+        for word in re.findall(r"[A-Za-z]{3,}", question):
+            if word.lower() in _COMMON_WORDS:
+                continue
+            symbol = universe.lookup_name(word, first_word=False)
+            if symbol:
+                return symbol
+        
+        return None
@@ -0,0 +1,116 @@
+"""
+Risk Metrics
+Drawdown, risk-adjusted return, higher moments and benchmark beta in one pass over a close series
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from tools.analytics_engine import TRADING_DAYS, daily_returns
+
+
+def align_on_dates(
+    dates: np.ndarray,
+    closes: np.ndarray,
+    other_dates: np.ndarray,
+    other_closes: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Closes of two series on the dates they have in common
+
+    Args:
+        dates: Sorted bar days of the first series
+        closes: Closes of the first series
+        other_dates: Sorted bar days of the second series
+        other_closes: Closes of the second series
+
+    Returns:
+        Tuple of aligned close arrays (same length, same dates)
+    """
+    _, left, right = np.intersect1d(dates, other_dates, assume_unique=True, return_indices=True)
+    return closes[left], other_closes[right]
+
+
+def compute_risk_metrics(
+    closes: np.ndarray,
+    dates: Optional[np.ndarray] = None,
+    benchmark_closes: Optional[np.ndarray] = None,
+    benchmark_dates: Optional[np.ndarray] = None,
+    risk_free_rate: float = 0.0,
+    periods_per_year: int = TRADING_DAYS
+) -> Dict[str, Optional[float]]:
+    """
+    Risk metrics pack for one close series
+
+    Returns are computed once and every moment is taken from the same
+    demeaned array; drawdowns come from one running-maximum pass.
+
+    Args:
+        closes: Daily closes, oldest first
+        dates: Bar days for closes (needed to align with a benchmark)
+        benchmark_closes: Benchmark closes for beta and correlation
+        benchmark_dates: Bar days for the benchmark closes
+        risk_free_rate: Annual risk-free rate as a fraction (e.g. 0.04)
+        periods_per_year: Return observations per year
+
+    Returns:
+        Dict with max_drawdown_pct, max_drawdown_days, sharpe_ratio,
+        sortino_ratio, downside_deviation_pct, skew and excess kurtosis
+        (population moments), beta and correlation (None where there is
+        not enough data)
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    metrics: Dict[str, Optional[float]] = dict.fromkeys((
+        "max_drawdown_pct", "max_drawdown_days", "sharpe_ratio", "sortino_ratio",
+        "downside_deviation_pct", "skew", "kurtosis", "beta", "correlation",
+    ))
+    if len(closes) < 3:
+        return metrics
+
+    # Drawdown depth and the longest stretch spent below a previous peak
+    peaks = np.maximum.accumulate(closes)
+    drawdowns = closes / peaks - 1
+    positions = np.arange(len(closes))
+    last_peak = np.maximum.accumulate(np.where(closes >= peaks, positions, 0))
+    metrics["max_drawdown_pct"] = float(drawdowns.min() * 100)
+    metrics["max_drawdown_days"] = int((positions - last_peak).max())
+
+    returns = daily_returns(closes)
+    returns = returns[np.isfinite(returns)]
+    n = len(returns)
+    if n < 3:
+        return metrics
+
+    excess = returns - risk_free_rate / periods_per_year
+    mean = returns.mean()
+    deviations = returns - mean
+    m2 = (deviations * deviations).mean()
+    std = np.sqrt(m2 * n / (n - 1))
+    downside = np.minimum(excess, 0.0)
+    downside_dev = np.sqrt((downside * downside).mean())
+    annual_excess = excess.mean() * periods_per_year
+
+    if std > 0:
+        metrics["sharpe_ratio"] = float(annual_excess / (std * np.sqrt(periods_per_year)))
+        metrics["skew"] = float((deviations ** 3).mean() / m2 ** 1.5)
+        metrics["kurtosis"] = float((deviations ** 4).mean() / (m2 * m2) - 3)
+    if downside_dev > 0:
+        metrics["sortino_ratio"] = float(annual_excess / (downside_dev * np.sqrt(periods_per_year)))
+    metrics["downside_deviation_pct"] = float(downside_dev * np.sqrt(periods_per_year) * 100)
+
+    if benchmark_closes is not None and dates is not None and benchmark_dates is not None:
+        asset, bench = align_on_dates(dates, closes, benchmark_dates, np.asarray(benchmark_closes, dtype=np.float64))
+        asset_returns, bench_returns = daily_returns(asset), daily_returns(bench)
+        finite = np.isfinite(asset_returns) & np.isfinite(bench_returns)
+        asset_returns, bench_returns = asset_returns[finite], bench_returns[finite]
+        if len(bench_returns) >= 3:
+            a = asset_returns - asset_returns.mean()
+            b = bench_returns - bench_returns.mean()
+            var_a, var_b, cov = (a * a).sum(), (b * b).sum(), (a * b).sum()
+            if var_b > 0:
+                metrics["beta"] = float(cov / var_b)
+            if var_a > 0 and var_b > 0:
+                metrics["correlation"] = float(cov / np.sqrt(var_a * var_b))
+
+    return metrics
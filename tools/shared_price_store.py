@@ -0,0 +1,234 @@
+"""
+Shared Price Store
+Memory-mapped daily price files shared read-only by every process on the host
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from tools.cache_files import atomic_write
+from tools.price_history import PriceHistory
+from tools.price_store import period_cutoff
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, every process may write
+    fcntl = None
+
+
+_EPOCH = np.datetime64("1970-01-01", "D")
+
+# 64-byte file header followed by fixed-size bar records
+HEADER = np.dtype([("magic", "S4"), ("covered_from", "<i4"), ("tz", "S56")])
+RECORD = np.dtype([("day", "<i4"), ("close", "<f8"), ("volume", "<f8")], align=True)
+MAGIC = b"PXS1"
+
+
+class SharedPriceStore:
+    """
+    Per-symbol bar files that many processes map without copying.
+
+    Each file is a header (covered-from day and timezone) followed by
+    ``RECORD`` rows of epoch day, close and volume. Only one process (the
+    writer, chosen with an advisory lock) updates the files: it appends new
+    bars in place, and rewrites a file atomically when its coverage grows
+    backwards or upstream re-adjusted the stored bars. Readers map files read-only with ``np.memmap``, so the
+    OS page cache holds one copy of each history for all processes, and
+    ``read`` returns PriceHistory views on those pages.
+    """
+
+    def __init__(self, root: str, writer: bool = False):
+        self.root = Path(root).expanduser()
+        self._maps: Dict[str, Tuple[int, int, np.ndarray, np.void]] = {}
+        self._lock = threading.Lock()
+        self._lock_handle = None
+        self.writer = writer and self._acquire_writer_lock()
+
+    @classmethod
+    def from_env(cls) -> Optional["SharedPriceStore"]:
+        """
+        Store under ``SHARED_PRICE_STORE_DIR``, or None when unset
+
+        The process becomes the writer when ``SHARED_PRICE_STORE_WRITER`` is
+        set to 1 and no other process holds the writer lock.
+        """
+        root = os.environ.get("SHARED_PRICE_STORE_DIR")
+        if not root:
+            return None
+        writer = os.environ.get("SHARED_PRICE_STORE_WRITER", "").lower() in ("1", "true", "yes")
+        return cls(root, writer=writer)
+
+    def written_at(self, symbol: str) -> Optional[float]:
+        """Epoch seconds of the last write for a symbol, or None if not stored"""
+        try:
+            return self._path(symbol).stat().st_mtime
+        except OSError:
+            return None
+
+    def read(self, symbol: str, period: str) -> Optional[PriceHistory]:
+        """
+        Mapped history for a period
+
+        Args:
+            symbol: Stock ticker symbol
+            period: Time period (6mo, 1y, 2y, etc.)
+
+        Returns:
+            PriceHistory backed by the shared pages, or None if the symbol
+            is not stored or the stored bars do not cover the period
+        """
+        mapped = self._map(symbol)
+        if mapped is None:
+            return None
+        records, header = mapped
+        cutoff = period_cutoff(period)
+        if cutoff is None or _day(cutoff) < int(header["covered_from"]):
+            return None
+        tz = header["tz"].decode() or None
+        history = PriceHistory(records["day"], records["close"], records["volume"], tz)
+        return history.slice_to_period(period)
+
+    def write(self, symbol: str, history: PriceHistory, period: str) -> None:
+        """
+        Store a freshly fetched history (writer process only)
+
+        Bars from the last stored day onwards are written in place; the file
+        is rewritten when the history reaches further back than it, or when
+        the last complete stored bar's close changed (a split or dividend
+        re-adjusted the series).
+
+        Args:
+            symbol: Stock ticker symbol
+            history: History covering the period
+            period: Time period the history was fetched for
+        """
+        cutoff = period_cutoff(period)
+        if not self.writer or cutoff is None or history.is_empty:
+            return
+
+        records = np.empty(len(history), dtype=RECORD)
+        records["day"] = history.dates
+        records["close"] = history.closes
+        records["volume"] = history.volume if history.volume is not None else 0.0
+
+        path = self._path(symbol)
+        header = _read_header(path)
+        tz = (history.tz or "").encode()
+        covered_from = _day(cutoff)
+        try:
+            if (
+                header is None
+                or covered_from < int(header["covered_from"])
+                or header["tz"] != tz
+                or not self._append(path, records)
+            ):
+                self._rewrite(path, covered_from, tz, records)
+        except OSError:
+            # Disk errors only cost sharing; the fetched history is still usable
+            pass
+
+    def _append(self, path: Path, records: np.ndarray) -> bool:
+        """Write bars from the last stored day on; False if the stored bars need a rewrite"""
+        with open(path, "r+b") as handle:
+            count = (os.fstat(handle.fileno()).st_size - HEADER.itemsize) // RECORD.itemsize
+            position = count
+            if count:
+                tail = min(count, 2)
+                handle.seek(HEADER.itemsize + (count - tail) * RECORD.itemsize)
+                stored = np.frombuffer(handle.read(tail * RECORD.itemsize), dtype=RECORD)
+                if tail > 1 and not _same_close(stored[0], records):
+                    # Upstream re-adjusted the series (split or dividend)
+                    return False
+                last_day = int(stored["day"][-1])
+                records = records[records["day"] >= last_day]
+                # The last stored bar may have been a partial session: overwrite it
+                if len(records) and int(records["day"][0]) == last_day:
+                    position = count - 1
+            if len(records):
+                handle.seek(HEADER.itemsize + position * RECORD.itemsize)
+                handle.write(records.tobytes())
+                handle.truncate()
+        # Mark the file as checked even when no new bars arrived
+        os.utime(path)
+        return True
+
+    def _rewrite(self, path: Path, covered_from: int, tz: bytes, records: np.ndarray) -> None:
+        header = np.zeros(1, dtype=HEADER)
+        header["magic"] = MAGIC
+        header["covered_from"] = covered_from
+        header["tz"] = tz
+
+        # Readers that mapped the old file keep its pages until they remap
+        with atomic_write(path) as handle:
+            handle.write(header.tobytes())
+            handle.write(records.tobytes())
+
+    def _map(self, symbol: str) -> Optional[Tuple[np.ndarray, np.void]]:
+        """Read-only mapping of a symbol's records, refreshed when the file changes"""
+        path = self._path(symbol)
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        count = (stat.st_size - HEADER.itemsize) // RECORD.itemsize
+        if count <= 0:
+            return None
+
+        key = symbol.upper()
+        with self._lock:
+            cached = self._maps.get(key)
+            if cached is not None and cached[:2] == (stat.st_ino, count):
+                return cached[2], cached[3]
+            header = _read_header(path)
+            if header is None:
+                return None
+            records = np.memmap(path, dtype=RECORD, mode="r", offset=HEADER.itemsize, shape=(count,))
+            self._maps[key] = (stat.st_ino, count, records, header)
+            return records, header
+
+    def _acquire_writer_lock(self) -> bool:
+        if fcntl is None:
+            return True
+        self.root.mkdir(parents=True, exist_ok=True)
+        handle = open(self.root / ".writer.lock", "a")
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            return False
+        # Held for the life of the process
+        self._lock_handle = handle
+        return True
+
+    def _path(self, symbol: str) -> Path:
+        return self.root / f"{symbol.upper().replace('/', '_')}.bars"
+
+
+def _day(timestamp) -> int:
+    return int((np.datetime64(timestamp.strftime("%Y-%m-%d"), "D") - _EPOCH).astype(np.int32))
+
+
+def _same_close(stored: np.void, records: np.ndarray) -> bool:
+    """Whether fresh records hold the stored (complete) bar with the same close"""
+    i = int(np.searchsorted(records["day"], stored["day"]))
+    return (
+        i < len(records)
+        and records["day"][i] == stored["day"]
+        and bool(np.isclose(records["close"][i], stored["close"], rtol=1e-5))
+    )
+
+
+def _read_header(path: Path) -> Optional[np.void]:
+    try:
+        with open(path, "rb") as handle:
+            raw = handle.read(HEADER.itemsize)
+    except OSError:
+        return None
+    if len(raw) < HEADER.itemsize:
+        return None
+    header = np.frombuffer(raw, dtype=HEADER)[0]
+    return header if header["magic"] == MAGIC else None
@@ -5,7 +5,6 @@ Handles simple factual questions about stocks
 
 from typing import Dict
 from tools.data_fetcher import DataFetcher
-import yfinance as yf
 
 
 class SimpleQueryHandler:
@@ -29,6 +28,8 @@ class SimpleQueryHandler:
         
         if not symbol:
             return "Error: Could not identify stock symbol in question."
+        if not self.data_fetcher.universe.contains(symbol):
+            return f"Error: Unknown symbol {symbol}."
         
         if subtype == "current_price":
             return self._get_current_price(symbol)
@@ -42,17 +43,16 @@ class SimpleQueryHandler:
     def _get_current_price(self, symbol: str) -> str:
         """Get current price"""
         try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
-            current_price = info.get("currentPrice") or info.get("regularMarketPrice")
+            quote = self.data_fetcher.load_quote(symbol, ("last_price",))
+            current_price = quote.get("last_price")
             
             if current_price:
                 return f"The current price of {symbol} is ${current_price:.2f}"
             else:
                 # Fallback to historical data
-                hist = ticker.history(period="1d")
-                if not hist.empty:
-                    price = hist['Close'].iloc[-1]
+                hist = self.data_fetcher.load_history(symbol, "5d")
+                if len(hist) > 0:
+                    price = hist.closes[-1]
                     return f"The current price of {symbol} is ${price:.2f}"
                 else:
                     return f"Could not retrieve current price for {symbol}"
@@ -62,16 +62,16 @@ class SimpleQueryHandler:
     def _get_yesterday_price(self, symbol: str) -> str:
         """Get yesterday's closing price"""
         try:
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period="5d")
+            # Sliced from the cached history window when one is loaded
+            hist = self.data_fetcher.load_history(symbol, "5d")
             
             if len(hist) >= 2:
-                yesterday_price = hist['Close'].iloc[-2]  # Second to last is yesterday
-                date = hist.index[-2].strftime("%Y-%m-%d")
+                yesterday_price = hist.closes[-2]  # Second to last is yesterday
+                date = hist.date_str(-2)
                 return f"{symbol}'s closing price yesterday ({date}) was ${yesterday_price:.2f}"
             elif len(hist) == 1:
-                yesterday_price = hist['Close'].iloc[-1]
-                date = hist.index[-1].strftime("%Y-%m-%d")
+                yesterday_price = hist.closes[-1]
+                date = hist.date_str(-1)
                 return f"{symbol}'s most recent closing price ({date}) was ${yesterday_price:.2f}"
             else:
                 return f"Could not retrieve yesterday's price for {symbol}"
@@ -81,9 +81,8 @@ class SimpleQueryHandler:
     def _get_market_cap(self, symbol: str) -> str:
         """Get market capitalization"""
         try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
-            market_cap = info.get("marketCap")
+            quote = self.data_fetcher.load_quote(symbol, ("market_cap",))
+            market_cap = quote.get("market_cap")
             
             if market_cap:
                 # Format market cap
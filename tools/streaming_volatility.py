@@ -0,0 +1,248 @@
+"""
+Streaming Volatility
+Rolling annualized volatility with O(1) updates per bar (Welford's method)
+"""
+
+import math
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+import numpy as np
+
+from tools.analytics_engine import TRADING_DAYS
+from tools.price_history import PriceHistory
+
+
+class RollingVolatility:
+    """
+    Running count, mean and M2 of the last ``window`` daily returns.
+
+    Returns live in a ring buffer together with the day of the bar each one
+    ends on. Adding a bar is O(1): the new return enters with Welford's
+    update and, once the window is full, the oldest one leaves with the
+    inverse update. Re-sending the latest day (an intraday tick) replaces
+    its return instead of adding one. The close of the last complete bar
+    is kept so ``matches`` can detect a history that upstream re-adjusted
+    for a split or dividend. Non-finite returns occupy a slot but
+    are left out of the statistics. The sums are recomputed from the buffer
+    every ``window`` updates so rounding error cannot accumulate.
+    """
+
+    def __init__(self, window: int, periods_per_year: int = TRADING_DAYS):
+        if window < 2:
+            raise ValueError("window must be at least 2 returns")
+        self.window = window
+        self.periods_per_year = periods_per_year
+        self._returns = np.full(window, math.nan)
+        self._days = np.zeros(window, dtype=np.int64)
+        self._start = 0
+        self._size = 0
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._updates = 0
+        self._last_day: Optional[int] = None
+        self._prev_day: Optional[int] = None
+        self._last_close = math.nan
+        self._prev_close = math.nan
+
+    def seed(self, days: np.ndarray, closes: np.ndarray) -> float:
+        """
+        Reset the stream to the last ``window`` returns of a close series
+
+        Args:
+            days: Bar days, increasing
+            closes: Closes aligned with days
+
+        Returns:
+            Annualized volatility in percent
+        """
+        days = np.asarray(days, dtype=np.int64)[-(self.window + 1):]
+        closes = np.asarray(closes, dtype=np.float64)[-(self.window + 1):]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = closes[1:] / closes[:-1] - 1
+
+        self._size = len(returns)
+        self._start = 0
+        self._returns[:self._size] = returns
+        self._days[:self._size] = days[1:]
+        self._updates = self.window - 1  # Recompute the sums on this call
+        self._after_update()
+        self._last_day = int(days[-1]) if len(days) else None
+        self._prev_day = int(days[-2]) if len(days) > 1 else None
+        self._last_close = float(closes[-1]) if len(closes) else math.nan
+        self._prev_close = float(closes[-2]) if len(closes) > 1 else math.nan
+        return self.volatility
+
+    def update(self, day: int, close: float) -> float:
+        """
+        Add a bar, or revise the latest bar when ``day`` repeats it
+
+        Args:
+            day: Bar date as an integer that increases with time (e.g. epoch day)
+            close: Closing (or latest) price
+
+        Returns:
+            Annualized volatility in percent after the update
+        """
+        if self._last_day is not None and day < self._last_day:
+            raise ValueError("bars must arrive in date order")
+        if day == self._last_day:
+            if self._size:
+                self._pop_newest()
+            self._last_close = close
+        else:
+            self._prev_close, self._last_close = self._last_close, close
+            self._prev_day, self._last_day = self._last_day, day
+            if self._size == self.window:
+                self._pop_oldest()
+
+        if not math.isnan(self._prev_close):
+            self._push(day, close / self._prev_close - 1 if self._prev_close else math.nan)
+        return self.volatility
+
+    def matches(self, history: PriceHistory) -> bool:
+        """
+        Whether a history still has the close this stream saw for its last complete bar
+
+        The latest bar is left out since intraday ticks revise it; a changed
+        earlier close means upstream back-adjusted the series (split or
+        dividend) and the stored returns are stale.
+        """
+        if self._prev_day is None or math.isnan(self._prev_close):
+            return True
+        close = history.close_on(self._prev_day)
+        return close is not None and math.isclose(close, self._prev_close, rel_tol=1e-5)
+
+    @property
+    def volatility(self) -> float:
+        """Annualized sample volatility in percent (NaN with fewer than two returns)"""
+        if self._count < 2:
+            return float("nan")
+        variance = max(self._m2, 0.0) / (self._count - 1)
+        return math.sqrt(variance * self.periods_per_year) * 100
+
+    @property
+    def first_day(self) -> Optional[int]:
+        """Day of the bar the oldest return in the window ends on"""
+        return int(self._days[self._start]) if self._size else None
+
+    @property
+    def last_day(self) -> Optional[int]:
+        return self._last_day
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _push(self, day: int, value: float) -> None:
+        slot = (self._start + self._size) % self.window
+        self._returns[slot] = value
+        self._days[slot] = day
+        self._size += 1
+        if math.isfinite(value):
+            self._count += 1
+            delta = value - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (value - self._mean)
+        self._after_update()
+
+    def _pop_oldest(self) -> None:
+        self._remove(float(self._returns[self._start]))
+        self._start = (self._start + 1) % self.window
+        self._size -= 1
+
+    def _pop_newest(self) -> None:
+        self._size -= 1
+        self._remove(float(self._returns[(self._start + self._size) % self.window]))
+
+    def _remove(self, value: float) -> None:
+        if not math.isfinite(value):
+            return
+        self._count -= 1
+        if self._count == 0:
+            self._mean = self._m2 = 0.0
+            return
+        delta = value - self._mean
+        self._mean -= delta / self._count
+        self._m2 -= delta * (value - self._mean)
+
+    def _after_update(self) -> None:
+        self._updates += 1
+        if self._updates >= self.window:
+            self._updates = 0
+            order = (self._start + np.arange(self._size)) % self.window
+            values = self._returns[order]
+            values = values[np.isfinite(values)]
+            self._count = len(values)
+            self._mean = float(values.mean()) if self._count else 0.0
+            self._m2 = float(((values - self._mean) ** 2).sum()) if self._count else 0.0
+
+
+class VolatilityRegistry:
+    """
+    Rolling volatility streams per (symbol, window key), LRU-bounded.
+
+    ``sync`` lines a stream up with a freshly loaded PriceHistory: bars the
+    stream has already seen are skipped and only newer ones are applied,
+    so a refresh that adds one bar costs O(1) instead of a full rescan.
+    When the stream no longer matches the history (first use, gaps, a
+    changed window, or closes re-adjusted upstream) it is rebuilt from the
+    history once.
+    """
+
+    def __init__(self, max_streams: int = 4096):
+        self.max_streams = max_streams
+        self._streams: "OrderedDict[Hashable, RollingVolatility]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def sync(self, symbol: str, key: Hashable, history: PriceHistory) -> float:
+        """
+        Volatility of all returns in a history, updated incrementally
+
+        Args:
+            symbol: Stock ticker symbol
+            key: Window identifier, e.g. the period string
+            history: Daily closes, oldest first
+
+        Returns:
+            Annualized volatility in percent (NaN with fewer than two returns)
+        """
+        window = len(history) - 1
+        if window < 2:
+            return float("nan")
+        dates = history.dates
+        stream_key = (symbol.upper(), key)
+
+        with self._lock:
+            stream = self._streams.get(stream_key)
+            if (
+                stream is not None
+                and stream.window == window
+                and stream.last_day is not None
+                and stream.matches(history)
+            ):
+                # Apply only bars from the stream's last day onwards
+                start = int(np.searchsorted(dates, stream.last_day))
+                if start < len(dates) and int(dates[start]) == stream.last_day and len(dates) - start <= window:
+                    for i in range(start, len(dates)):
+                        stream.update(int(dates[i]), float(history.closes[i]))
+                    if stream.first_day == int(dates[1]):
+                        self._streams.move_to_end(stream_key)
+                        return stream.volatility
+
+            stream = RollingVolatility(window)
+            stream.seed(dates, history.closes)
+            self._streams[stream_key] = stream
+            self._streams.move_to_end(stream_key)
+            while len(self._streams) > self.max_streams:
+                self._streams.popitem(last=False)
+            return stream.volatility
+
+    def get(self, symbol: str, key: Hashable) -> Optional[RollingVolatility]:
+        """Stream for a symbol and window key, if one exists"""
+        with self._lock:
+            return self._streams.get((symbol.upper(), key))
+
+    def __len__(self) -> int:
+        return len(self._streams)
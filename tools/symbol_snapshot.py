@@ -0,0 +1,83 @@
+"""
+Symbol Snapshot
+Per-query view of one symbol's history, info and news, fetched at most once
+"""
+
+from typing import Dict, List, Optional
+
+from tools.price_history import PriceHistory
+
+
+class SymbolSnapshot:
+    """
+    Holds the raw upstream data for one symbol during a single query.
+
+    Every piece of data is loaded lazily on first access and then reused,
+    so all agents working on the same query share one load per data type.
+    Loads go through the fetcher's ``load_history``/``load_info``/``load_news``
+    (normally DataFetcher), which apply caching before hitting the provider.
+    """
+
+    def __init__(self, symbol: str, fetcher):
+        self.symbol = symbol
+        self.fetcher = fetcher
+        self._history: Dict[str, PriceHistory] = {}
+        self._info: Optional[Dict] = None
+        self._news: Optional[List[Dict]] = None
+        self._ages: Dict[str, Optional[float]] = {}
+
+    def history(self, period: str = "1y") -> PriceHistory:
+        """
+        Price history for a period, loaded once per period
+
+        Args:
+            period: Time period (6mo, 1y, 2y, etc.)
+
+        Returns:
+            PriceHistory of daily closes (may be empty)
+        """
+        if period not in self._history:
+            self._history[period] = self.fetcher.load_history(self.symbol, period)
+            self._record_age("history")
+        return self._history[period]
+
+    def info(self) -> Dict:
+        """Company info payload, loaded once"""
+        if self._info is None:
+            self._info = self.fetcher.load_info(self.symbol) or {}
+            self._record_age("info")
+        return self._info
+
+    def news(self) -> List[Dict]:
+        """Raw news items, loaded once"""
+        if self._news is None:
+            self._news = self.fetcher.load_news(self.symbol) or []
+            self._record_age("news")
+        return self._news
+
+    def data_age(self, kind: str) -> Optional[float]:
+        """
+        Age in seconds of the loaded data of a kind when it was loaded
+
+        Args:
+            kind: "history", "info" or "news"
+
+        Returns:
+            Age in seconds, or None if not loaded or not cached
+        """
+        return self._ages.get(kind)
+
+    def _record_age(self, kind: str) -> None:
+        data_age = getattr(self.fetcher, "data_age", None)
+        self._ages[kind] = data_age(kind, self.symbol) if data_age else None
+
+
+def format_data_age(seconds: Optional[float]) -> str:
+    """Human-readable data age, e.g. "live", "42s", "5 min", "3.0 h\""""
+    if seconds is None or seconds < 1:
+        return "live"
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    if seconds < 3600:
+        return f"{seconds / 60:.0f} min"
+    return f"{seconds / 3600:.1f} h"
@@ -0,0 +1,191 @@
+"""
+Ticker Universe
+Memory-resident index of listed symbols and company names for local symbol validation
+
+Listings use the Nasdaq Trader symbol directory format (nasdaqlisted.txt and
+otherlisted.txt, pipe-delimited). Fetch them with:
+
+    python3 -m tools.ticker_universe --download
+"""
+
+import argparse
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from tools.http_session import get_session
+
+
+LISTING_URLS = (
+    "https://www.nasdaqtrader.com/dynamic/SymDir/nasdaqlisted.txt",
+    "https://www.nasdaqtrader.com/dynamic/SymDir/otherlisted.txt",
+)
+
+# Words dropped from company names before indexing them
+_NAME_NOISE = {
+    "inc", "corp", "corporation", "co", "company", "ltd", "limited", "plc", "sa", "nv", "ag",
+    "holdings", "holding", "group", "the", "class", "common", "stock", "shares", "ordinary",
+}
+
+
+def _is_special_symbol(symbol: str) -> bool:
+    """Indices, FX pairs, futures and crypto pairs are not in exchange listings"""
+    return symbol.startswith("^") or symbol.endswith(("=X", "=F")) or bool(re.fullmatch(r"[A-Z0-9]+-USD", symbol))
+
+
+def _normalize_name(name: str) -> str:
+    name = name.split(" - ")[0].lower()
+    words = [w for w in re.findall(r"[a-z0-9&]+", name) if w not in _NAME_NOISE]
+    return " ".join(words)
+
+
+class TickerUniverse:
+    """
+    Set of listed symbols plus a company-name index.
+
+    An empty universe (no listing files found) is treated as unavailable and
+    accepts every symbol, so a missing index never blocks real lookups.
+    """
+
+    def __init__(self, listings: Optional[Dict[str, str]] = None):
+        listings = listings or {}
+        self._symbols = frozenset(listings)
+        self._names: Dict[str, str] = {}
+        self._first_words: Dict[str, str] = {}
+
+        # Index full normalized names and, separately, their first word. On
+        # collisions keep the company with the shortest name ("apple" -> Apple
+        # Inc, not Apple Hospitality REIT).
+        ranked = sorted(listings.items(), key=lambda item: len(_normalize_name(item[1])))
+        for symbol, name in ranked:
+            normalized = _normalize_name(name)
+            if not normalized:
+                continue
+            self._names.setdefault(normalized, symbol)
+            first_word = normalized.split()[0]
+            if len(first_word) >= 3:
+                self._first_words.setdefault(first_word, symbol)
+
+    @property
+    def available(self) -> bool:
+        return bool(self._symbols)
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def contains(self, symbol: Optional[str]) -> bool:
+        """
+        Whether a symbol is listed (always True when the universe is unavailable)
+
+        Args:
+            symbol: Ticker symbol (case-insensitive)
+
+        Returns:
+            True if the symbol can be looked up upstream
+        """
+        if not symbol:
+            return False
+        symbol = symbol.upper()
+        return not self.available or symbol in self._symbols or _is_special_symbol(symbol)
+
+    def lookup_name(self, text: str, first_word: bool = True) -> Optional[str]:
+        """
+        Symbol for a company name such as "apple" or "Microsoft Corporation"
+
+        Args:
+            text: Company name or its first word
+            first_word: Also match the first word of a longer name ("good"
+                for Good Times Restaurants); only safe for words already
+                known to name a company
+
+        Returns:
+            Ticker symbol, or None if the name is unknown
+        """
+        normalized = _normalize_name(text)
+        symbol = self._names.get(normalized)
+        if symbol is None and first_word:
+            symbol = self._first_words.get(normalized)
+        return symbol
+
+    def resolve(self, word: Optional[str]) -> Optional[str]:
+        """
+        Symbol for a word that is either a listed ticker or a company name
+
+        Args:
+            word: Candidate taken from a question
+
+        Returns:
+            Ticker symbol, or None if the word is neither
+        """
+        if not word:
+            return None
+        if self.contains(word):
+            return word.upper()
+        return self.lookup_name(word)
+
+    @classmethod
+    def from_listing_files(cls, paths: Iterable[Path]) -> "TickerUniverse":
+        """
+        Build the universe from Nasdaq Trader symbol directory files
+
+        Args:
+            paths: nasdaqlisted.txt / otherlisted.txt style files
+
+        Returns:
+            TickerUniverse over all non-test issues
+        """
+        listings: Dict[str, str] = {}
+        for path in paths:
+            with open(path, encoding="utf-8", errors="replace") as handle:
+                header = handle.readline().strip().split("|")
+                symbol_col = header.index("ACT Symbol") if "ACT Symbol" in header else header.index("Symbol")
+                name_col = header.index("Security Name")
+                test_col = header.index("Test Issue") if "Test Issue" in header else None
+                for line in handle:
+                    fields = line.rstrip("\n").split("|")
+                    if len(fields) < len(header) or line.startswith("File Creation Time"):
+                        continue
+                    if test_col is not None and fields[test_col] == "Y":
+                        continue
+                    # Yahoo writes share classes with a dash (BRK.B -> BRK-B)
+                    symbol = fields[symbol_col].strip().upper().replace(".", "-")
+                    if symbol:
+                        listings[symbol] = fields[name_col].strip()
+        return cls(listings)
+
+    @classmethod
+    def default(cls) -> "TickerUniverse":
+        """Universe from ``TICKER_UNIVERSE_DIR`` or ``data/universe`` (empty if absent)"""
+        directory = Path(os.environ.get("TICKER_UNIVERSE_DIR") or default_directory())
+        paths = sorted(directory.glob("*.txt")) if directory.is_dir() else []
+        return cls.from_listing_files(paths)
+
+
+def default_directory() -> Path:
+    return Path(__file__).resolve().parent.parent / "data" / "universe"
+
+
+def download_listings(directory: Path) -> None:
+    """Download the Nasdaq Trader symbol directory files into a directory"""
+    directory.mkdir(parents=True, exist_ok=True)
+    for url in LISTING_URLS:
+        target = directory / url.rsplit("/", 1)[-1]
+        response = get_session().get(url, timeout=30)
+        response.raise_for_status()
+        target.write_bytes(response.content)
+        print(f"Saved {target}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ticker universe index")
+    parser.add_argument("--download", action="store_true", help="download exchange listing files")
+    parser.add_argument("--dir", default=os.environ.get("TICKER_UNIVERSE_DIR") or str(default_directory()))
+    args = parser.parse_args()
+
+    if args.download:
+        download_listings(Path(args.dir))
+    universe = TickerUniverse.from_listing_files(sorted(Path(args.dir).glob("*.txt")))
+    print(f"{len(universe)} symbols indexed")
+    sys.exit(0)
@@ -0,0 +1,306 @@
+"""
+Tiered Cache
+Size-bounded in-process LRU backed by a local disk tier, with per-tier counters
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from tools.cache_files import atomic_write
+
+
+_MISSING = object()
+
+
+def estimate_size(value: Any, _seen: Optional[set] = None) -> int:
+    """
+    Approximate resident size of a value in bytes
+
+    NumPy arrays (and anything else exposing an integer ``nbytes``) count
+    their buffers; containers and plain objects are walked recursively.
+
+    Args:
+        value: Object to measure
+
+    Returns:
+        Estimated size in bytes
+    """
+    _seen = set() if _seen is None else _seen
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes + sys.getsizeof(0)
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(k, _seen) + estimate_size(v, _seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, _seen) for item in value)
+    elif hasattr(value, "__dict__"):
+        size += estimate_size(vars(value), _seen)
+    elif hasattr(value, "__slots__"):
+        size += sum(estimate_size(getattr(value, name, None), _seen) for name in value.__slots__)
+    return size
+
+
+@dataclass
+class TierStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+class MemoryTier:
+    """
+    Thread-safe LRU bounded by both entry count and estimated bytes.
+
+    Values larger than the whole byte budget are not stored at all.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 2048, max_bytes: int = 256 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = TierStats()
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                self.stats.misses += 1
+                return _MISSING
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return item[0]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        size = estimate_size(value)
+        with self._lock:
+            self._remove(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self.stats.bytes += size
+            while len(self._entries) > self.max_entries or self.stats.bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+            self.stats.entries = len(self._entries)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._remove(key)
+            self.stats.entries = len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.stats.entries = self.stats.bytes = 0
+
+    def _remove(self, key: Hashable) -> None:
+        item = self._entries.pop(key, None)
+        if item is not None:
+            self.stats.bytes -= item[1]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskTier:
+    """
+    Pickled entries in a local directory, bounded by total file size.
+
+    Files are written atomically (temp file + rename), so several processes
+    on one host can share the directory. When the size budget is exceeded
+    the least recently used files are deleted; reads refresh a file's mtime.
+    Each process rescans the directory at least every ``rescan_interval``
+    seconds, so files written by other processes count against
+    ``max_bytes`` too; between rescans a shared directory can overshoot
+    by what the other processes wrote in that time.
+    Only point this at a directory the application itself owns, since
+    entries are unpickled.
+    """
+
+    name = "disk"
+
+    def __init__(self, root: str, max_bytes: int = 1024 * 1024 * 1024, rescan_interval: float = 60.0):
+        self.root = Path(root).expanduser()
+        self.max_bytes = max_bytes
+        self.rescan_interval = rescan_interval
+        self.stats = TierStats()
+        self._index: Optional[Dict[Path, Tuple[int, float]]] = None
+        self._scanned_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as handle:
+                stored_key, value = pickle.load(handle)
+            os.utime(path)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, ValueError):
+            stored_key, value = None, _MISSING
+        with self._lock:
+            if value is _MISSING or stored_key != key:
+                self.stats.misses += 1
+                return _MISSING
+            self.stats.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        try:
+            payload = pickle.dumps((key, value), protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        if len(payload) > self.max_bytes:
+            return
+
+        path = self._path(key)
+        try:
+            with atomic_write(path) as handle:
+                handle.write(payload)
+        except OSError:
+            return
+
+        with self._lock:
+            index = self._load_index()
+            index[path] = (len(payload), os.path.getmtime(path) if path.exists() else 0.0)
+            self._evict(index)
+            self._update_stats(index)
+
+    def delete(self, key: Hashable) -> None:
+        path = self._path(key)
+        try:
+            path.unlink()
+        except OSError:
+            pass
+        with self._lock:
+            index = self._load_index()
+            index.pop(path, None)
+            self._update_stats(index)
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in list(self._load_index()):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            self._index = {}
+            self._scanned_at = time.monotonic()
+            self._update_stats(self._index)
+
+    def _load_index(self) -> Dict[Path, Tuple[int, float]]:
+        """Sizes and mtimes of the cache files, rescanned every rescan_interval seconds"""
+        now = time.monotonic()
+        if self._index is None or now - self._scanned_at >= self.rescan_interval:
+            self._index = {}
+            self._scanned_at = now
+            if self.root.is_dir():
+                for path in self.root.glob("*.pkl"):
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    self._index[path] = (stat.st_size, stat.st_mtime)
+        return self._index
+
+    def _evict(self, index: Dict[Path, Tuple[int, float]]) -> None:
+        total = sum(size for size, _ in index.values())
+        if total <= self.max_bytes:
+            return
+        # Refresh mtimes so entries read by any process count as recently used
+        for path in list(index):
+            try:
+                index[path] = (index[path][0], path.stat().st_mtime)
+            except OSError:
+                total -= index.pop(path)[0]
+        for path in sorted(index, key=lambda p: index[p][1]):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            total -= index.pop(path)[0]
+            self.stats.evictions += 1
+
+    def _update_stats(self, index: Dict[Path, Tuple[int, float]]) -> None:
+        self.stats.entries = len(index)
+        self.stats.bytes = sum(size for size, _ in index.values())
+
+    def _path(self, key: Hashable) -> Path:
+        return self.root / (hashlib.sha1(repr(key).encode()).hexdigest() + ".pkl")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load_index())
+
+
+class TieredCache:
+    """
+    Looks keys up tier by tier (fastest first).
+
+    Writes go to every tier; a hit in a lower tier is copied into the tiers
+    above it, so hot keys migrate back into memory while the memory tier
+    only holds what fits its bounds.
+    """
+
+    def __init__(self, tiers: List):
+        self.tiers = tiers
+
+    def get(self, key: Hashable, default: Any = None, local: bool = False) -> Any:
+        """
+        Value for a key from the first tier that has it
+
+        Args:
+            key: Cache key
+            default: Returned when no tier has the key
+            local: Only look in the first (in-process) tier
+
+        Returns:
+            Cached value or default
+        """
+        for depth, tier in enumerate(self.tiers[:1] if local else self.tiers):
+            value = tier.get(key)
+            if value is not _MISSING:
+                for upper in self.tiers[:depth]:
+                    upper.set(key, value)
+                return value
+        return default
+
+    def set(self, key: Hashable, value: Any, local: bool = False) -> None:
+        """Store a value in every tier, or only the first one when local"""
+        for tier in self.tiers[:1] if local else self.tiers:
+            tier.set(key, value)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a key from every tier"""
+        for tier in self.tiers:
+            tier.delete(key)
+
+    def clear(self) -> None:
+        """Remove everything from every tier"""
+        for tier in self.tiers:
+            tier.clear()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit, miss, eviction, entry and byte counters per tier"""
+        return {tier.name: asdict(tier.stats) for tier in self.tiers}
+
+    def __len__(self) -> int:
+        return len(self.tiers[0]) if self.tiers else 0
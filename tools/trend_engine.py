@@ -0,0 +1,244 @@
+"""
+Trend Engine
+Moving-average, momentum and breakout signals in O(n) per window over a series or close matrix
+"""
+
+from dataclasses import dataclass
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class TrendSignals:
+    """
+    Latest trend signals per column of a close matrix, one array entry per symbol.
+
+    ``breakout`` is +1 when the last close tops the previous breakout-window
+    high, -1 when it falls below the previous low, else 0. ``crossover`` is
+    +1 (golden cross) or -1 (death cross) when the fast SMA crossed the slow
+    SMA within the last ``cross_lookback`` bars, else 0. ``score`` adds the
+    signs of the SMA spread, EMA spread, rate of change and breakout.
+    """
+
+    sma_fast: np.ndarray
+    sma_slow: np.ndarray
+    ema_fast: np.ndarray
+    ema_slow: np.ndarray
+    roc_pct: np.ndarray
+    breakout: np.ndarray
+    crossover: np.ndarray
+    score: np.ndarray
+
+    @property
+    def label(self) -> np.ndarray:
+        """"upward", "downward" or "sideways" per column"""
+        return np.where(self.score >= 2, "upward", np.where(self.score <= -2, "downward", "sideways"))
+
+    def to_dict(self, i: int = 0) -> Dict:
+        """Signals of column i as plain values (None where not enough bars)"""
+        def value(x):
+            x = float(x)
+            return round(x, 2) if np.isfinite(x) else None
+
+        return {
+            "score": int(self.score[i]),
+            "sma_fast": value(self.sma_fast[i]),
+            "sma_slow": value(self.sma_slow[i]),
+            "ema_fast": value(self.ema_fast[i]),
+            "ema_slow": value(self.ema_slow[i]),
+            "roc_pct": value(self.roc_pct[i]),
+            "breakout": int(self.breakout[i]),
+            "crossover": int(self.crossover[i]),
+        }
+
+
+def _as_matrix(closes: np.ndarray) -> np.ndarray:
+    closes = np.asarray(closes, dtype=np.float64)
+    return closes[:, None] if closes.ndim == 1 else closes
+
+
+def forward_fill(closes: np.ndarray) -> np.ndarray:
+    """
+    Carry the last valid close over missing rows (leading NaNs stay NaN)
+
+    Args:
+        closes: 1-D series or 2-D date-by-symbol matrix
+
+    Returns:
+        Array of the same shape
+    """
+    matrix = _as_matrix(closes)
+    rows = np.arange(len(matrix))[:, None]
+    last_valid = np.maximum.accumulate(np.where(np.isnan(matrix), 0, rows), axis=0)
+    filled = np.take_along_axis(matrix, last_valid, axis=0)
+    return filled.reshape(np.shape(closes))
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing mean over full windows from one cumulative sum
+
+    Args:
+        values: 1-D series or 2-D date-by-symbol matrix
+        window: Number of rows per window
+
+    Returns:
+        Array of the same shape; NaN until a window of valid values is available
+    """
+    matrix = _as_matrix(values)
+    valid = np.isfinite(matrix)
+    zero = np.zeros((1, matrix.shape[1]))
+    sums = np.concatenate([zero, np.cumsum(np.where(valid, matrix, 0.0), axis=0)])
+    counts = np.concatenate([zero, np.cumsum(valid, axis=0)])
+    out = np.full(matrix.shape, np.nan)
+    if 0 < window <= len(matrix):
+        window_sums = sums[window:] - sums[:-window]
+        full = counts[window:] - counts[:-window] == window
+        out[window - 1:] = np.where(full, window_sums / window, np.nan)
+    return out.reshape(np.shape(values))
+
+
+def rolling_max(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing maximum with the van Herk/Gil-Werman algorithm
+
+    The rows are cut into blocks of ``window``; a forward running maximum
+    within each block and a backward one give every window's maximum from
+    two lookups, so the cost does not depend on the window length. NaNs
+    are ignored.
+
+    Args:
+        values: 1-D series or 2-D date-by-symbol matrix
+        window: Number of rows per window
+
+    Returns:
+        Array of the same shape; NaN for the first window - 1 rows
+    """
+    matrix = _as_matrix(values)
+    n, cols = matrix.shape
+    out = np.full(matrix.shape, np.nan)
+    if 0 < window <= n:
+        blocks = -(-n // window)
+        padded = np.full((blocks * window, cols), np.nan)
+        padded[:n] = matrix
+        padded = padded.reshape(blocks, window, cols)
+        with np.errstate(invalid="ignore"):
+            prefix = np.fmax.accumulate(padded, axis=1).reshape(-1, cols)[:n]
+            suffix = np.fmax.accumulate(padded[:, ::-1], axis=1)[:, ::-1].reshape(-1, cols)[:n]
+        # Window [t - window + 1, t] = suffix of its first block + prefix of its last
+        out[window - 1:] = np.fmax(suffix[:n - window + 1], prefix[window - 1:])
+    return out.reshape(np.shape(values))
+
+
+def rolling_min(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing minimum (see rolling_max)"""
+    return -rolling_max(-np.asarray(values, dtype=np.float64), window)
+
+
+def ema(values: np.ndarray, span: int) -> np.ndarray:
+    """
+    Exponential moving average with alpha = 2 / (span + 1), one pass over the rows
+
+    Args:
+        values: 1-D series or 2-D date-by-symbol matrix
+        span: EMA span in rows
+
+    Returns:
+        Array of the same shape; NaN until span valid values have been seen
+    """
+    frame = pd.DataFrame(_as_matrix(values))
+    smoothed = frame.ewm(span=span, adjust=False, min_periods=span, ignore_na=True).mean()
+    return smoothed.to_numpy().reshape(np.shape(values))
+
+
+def rate_of_change(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Percent change over ``window`` rows
+
+    Args:
+        values: 1-D series or 2-D date-by-symbol matrix
+        window: Lag in rows
+
+    Returns:
+        Array of the same shape; NaN for the first window rows
+    """
+    matrix = _as_matrix(values)
+    out = np.full(matrix.shape, np.nan)
+    if 0 < window < len(matrix):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out[window:] = (matrix[window:] / matrix[:-window] - 1) * 100
+    return out.reshape(np.shape(values))
+
+
+def analyze_trend(
+    closes: np.ndarray,
+    fast: int = 20,
+    slow: int = 50,
+    roc_window: int = 20,
+    breakout_window: int = 55,
+    cross_lookback: int = 5
+) -> TrendSignals:
+    """
+    Trend signals at the last row of every column
+
+    Missing closes are forward-filled first. A signal that needs more
+    bars than the column has is NaN (or 0) and does not count in the score.
+
+    Args:
+        closes: 1-D series or 2-D date-by-symbol matrix, oldest row first
+        fast: Fast SMA/EMA window
+        slow: Slow SMA/EMA window
+        roc_window: Rate-of-change lag
+        breakout_window: Lookback for the previous high/low
+        cross_lookback: Bars in which an SMA crossover is reported
+
+    Returns:
+        TrendSignals with one entry per column
+    """
+    closes = forward_fill(_as_matrix(closes))
+    cols = closes.shape[1]
+    if not len(closes):
+        empty = np.full(cols, np.nan)
+        zeros = np.zeros(cols, dtype=int)
+        return TrendSignals(empty, empty, empty, empty, empty, zeros, zeros, zeros)
+    last = closes[-1]
+
+    sma_fast = rolling_mean(closes, fast)
+    sma_slow = rolling_mean(closes, slow)
+    ema_fast = ema(closes, fast)[-1]
+    ema_slow = ema(closes, slow)[-1]
+    roc = rate_of_change(closes, roc_window)[-1]
+
+    # Compare the last close with the range of the window before it
+    prior_high = prior_low = np.full(cols, np.nan)
+    if len(closes) > breakout_window:
+        prior_high = rolling_max(closes[:-1], breakout_window)[-1]
+        prior_low = rolling_min(closes[:-1], breakout_window)[-1]
+    breakout = np.where(last > prior_high, 1, np.where(last < prior_low, -1, 0))
+
+    # Sign of the fast-slow spread now versus cross_lookback bars ago
+    with np.errstate(invalid="ignore"):
+        spread = np.nan_to_num(np.sign(sma_fast - sma_slow))
+    before = spread[max(len(spread) - 1 - cross_lookback, 0)]
+    crossover = np.where((spread[-1] > 0) & (before < 0), 1, np.where((spread[-1] < 0) & (before > 0), -1, 0))
+
+    with np.errstate(invalid="ignore"):
+        score = (
+            spread[-1]
+            + np.nan_to_num(np.sign(ema_fast - ema_slow))
+            + np.nan_to_num(np.sign(roc))
+            + breakout
+        ).astype(int)
+
+    return TrendSignals(
+        sma_fast=sma_fast[-1],
+        sma_slow=sma_slow[-1],
+        ema_fast=ema_fast,
+        ema_slow=ema_slow,
+        roc_pct=roc,
+        breakout=breakout,
+        crossover=crossover,
+        score=score,
+    )
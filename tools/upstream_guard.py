@@ -0,0 +1,203 @@
+"""
+Upstream Guard
+Adaptive rate limiting, jittered retries and a circuit breaker around upstream calls
+"""
+
+import random
+import re
+import threading
+import time
+from typing import Any, Callable, Optional
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the upstream while the circuit breaker is open"""
+
+
+def is_throttle_error(error: BaseException) -> bool:
+    """Whether an exception looks like upstream throttling (HTTP 429 / rate limit)"""
+    text = f"{type(error).__name__} {error}".lower()
+    return "ratelimit" in text or "rate limit" in text or "429" in text or "too many requests" in text
+
+
+# Modules whose exceptions come from the HTTP transport rather than the payload
+_TRANSPORT_MODULES = ("requests", "urllib3", "curl_cffi", "http", "socket", "ssl")
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    Whether an exception means the upstream itself is unhealthy
+
+    True for throttling, transport failures (connection, timeout, TLS) and
+    HTTP 5xx responses. Per-symbol errors such as 404/not found, and errors
+    raised locally while handling a response, are False: retrying them
+    cannot help and they say nothing about the upstream's health.
+    """
+    if is_throttle_error(error):
+        return True
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    if isinstance(status, int):
+        return status >= 500
+    if re.search(r"\b(?:http(?: error)?|status(?: code)?:?) 5\d\d\b", str(error).lower()):
+        return True
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    return type(error).__module__.split(".")[0] in _TRANSPORT_MODULES
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with AIMD rate adaptation.
+
+    The refill rate is halved whenever the upstream throttles us and creeps
+    back up towards ``max_rate`` after each success.
+    """
+
+    def __init__(self, max_rate: float = 4.0, capacity: float = 8.0, min_rate: float = 0.25):
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.rate = max_rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then take it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def penalize(self) -> None:
+        """Halve the rate after a throttling response"""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def reward(self) -> None:
+        """Additively recover the rate after a successful call"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+
+class CircuitBreaker:
+    """
+    Classic closed / open / half-open circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls fail fast for ``reset_timeout`` seconds. Then a single trial call
+    is let through: success closes the circuit, failure re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a call may go to the upstream right now"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self.state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+
+class UpstreamGuard:
+    """
+    Wraps upstream calls with a rate limiter, retries and a circuit breaker.
+
+    Each attempt takes a token from the limiter. Transient failures (see
+    is_transient_error) are retried with full-jitter exponential backoff,
+    and a call that exhausts its retries counts as one breaker failure.
+    Any other error is raised at once and leaves the breaker closed, so a
+    run of unknown tickers cannot cut off every caller.
+    """
+
+    def __init__(
+        self,
+        limiter: Optional[TokenBucket] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        max_retries: int = 2,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0
+    ):
+        self.limiter = limiter or TokenBucket()
+        self.breaker = breaker or CircuitBreaker()
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    @classmethod
+    def unthrottled(cls) -> "UpstreamGuard":
+        """Guard without rate limiting or backoff, for local providers such as fixture replay"""
+        return cls(limiter=TokenBucket(max_rate=float("inf"), capacity=float("inf")), base_delay=0.0)
+
+    def call(self, fn: Callable[[], Any]) -> Any:
+        """
+        Call fn under rate limiting, retry and circuit breaking
+
+        Args:
+            fn: Upstream call
+
+        Returns:
+            Result of fn
+
+        Raises:
+            CircuitOpenError: If the upstream is currently considered unhealthy
+        """
+        if not self.breaker.allow():
+            raise CircuitOpenError("Upstream temporarily unavailable (circuit open)")
+
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            try:
+                result = fn()
+            except Exception as e:
+                if not is_transient_error(e):
+                    # The upstream answered; the failure is specific to this call
+                    self.breaker.record_success()
+                    raise
+                if is_throttle_error(e):
+                    self.limiter.penalize()
+                if attempt == self.max_retries:
+                    self.breaker.record_failure()
+                    raise
+                time.sleep(random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt)))
+            else:
+                self.breaker.record_success()
+                self.limiter.reward()
+                return result
@@ -0,0 +1,341 @@
+"""
+Volatility Forecast
+EWMA and GARCH(1,1) conditional volatility with O(1) updates and vectorized batch fitting
+"""
+
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Optional
+
+import numpy as np
+
+from tools.analytics_engine import TRADING_DAYS, daily_returns
+from tools.price_history import PriceHistory
+
+
+# RiskMetrics daily decay factor
+EWMA_LAMBDA = 0.94
+
+# Parameter grid searched by fit_garch (variance targeting fixes omega)
+_ALPHAS = np.arange(0.02, 0.205, 0.02)
+_BETAS = np.arange(0.70, 0.985, 0.02)
+
+
+@dataclass
+class GarchParams:
+    """
+    sigma2[t+1] = omega + alpha * r[t]**2 + beta * sigma2[t]
+
+    EWMA is the special case omega=0, alpha=1-lambda, beta=lambda.
+    """
+
+    omega: float
+    alpha: float
+    beta: float
+
+    @classmethod
+    def ewma(cls, lam: float = EWMA_LAMBDA) -> "GarchParams":
+        return cls(0.0, 1.0 - lam, lam)
+
+    @property
+    def persistence(self) -> float:
+        return self.alpha + self.beta
+
+    @property
+    def long_run_variance(self) -> Optional[float]:
+        """Unconditional daily variance, or None when the process does not mean-revert"""
+        if self.omega <= 0 or self.persistence >= 1:
+            return None
+        return self.omega / (1 - self.persistence)
+
+
+def _recursion(returns: np.ndarray, omega, alpha, beta, initial):
+    """
+    Run the variance recursion over time for many parameter sets and series at once
+
+    Args:
+        returns: (T, S) daily returns, NaN where a series has no bar
+        omega, alpha, beta: Arrays broadcastable to (G, S)
+        initial: Starting variance, broadcastable to (G, S)
+
+    Returns:
+        Tuple of (log-likelihood (G, S), next-step variance (G, S))
+    """
+    sigma2 = np.broadcast_to(initial, np.broadcast(omega, alpha, beta, initial).shape).astype(np.float64)
+    loglik = np.zeros_like(sigma2)
+    for r in returns:
+        observed = np.isfinite(r)
+        r2 = np.where(observed, r * r, 0.0)
+        loglik -= np.where(observed, 0.5 * (np.log(sigma2) + r2 / sigma2), 0.0)
+        sigma2 = np.where(observed, omega + alpha * r2 + beta * sigma2, sigma2)
+    return loglik, sigma2
+
+
+def fit_garch(returns: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Fit GARCH(1,1) to every column of a return matrix with one vectorized recursion
+
+    Uses variance targeting (omega = sample variance * (1 - alpha - beta))
+    and picks the (alpha, beta) pair with the highest Gaussian likelihood
+    from a fixed grid, so all symbols are fitted in one pass over time.
+
+    Args:
+        returns: (T,) or (T, S) daily returns, NaN for missing bars
+
+    Returns:
+        Dict of (S,) arrays: omega, alpha, beta and sigma2 (next-step variance)
+    """
+    returns = np.asarray(returns, dtype=np.float64)
+    if returns.ndim == 1:
+        returns = returns[:, None]
+
+    alpha, beta = np.meshgrid(_ALPHAS, _BETAS, indexing="ij")
+    keep = alpha + beta < 0.999
+    alpha, beta = alpha[keep][:, None], beta[keep][:, None]
+
+    sample_var = np.nanvar(returns, axis=0, ddof=1)
+    sample_var = np.where(np.isfinite(sample_var) & (sample_var > 0), sample_var, 1e-4)
+    omega = sample_var * (1 - alpha - beta)
+
+    loglik, sigma2 = _recursion(returns, omega, alpha, beta, sample_var)
+    best = loglik.argmax(axis=0)
+    cols = np.arange(returns.shape[1])
+    return {
+        "omega": omega[best, cols],
+        "alpha": alpha[best, 0],
+        "beta": beta[best, 0],
+        "sigma2": sigma2[best, cols],
+    }
+
+
+class VolatilityForecaster:
+    """
+    Conditional variance state for one symbol.
+
+    Each new close updates the next-step variance in O(1). Re-sending the
+    latest day (an intraday tick) recomputes that step from the variance
+    that applied before it instead of adding a step. The close of the last
+    complete bar is kept so ``matches`` can detect a history that upstream
+    re-adjusted for a split or dividend.
+    """
+
+    def __init__(
+        self,
+        params: GarchParams,
+        sigma2: float,
+        last_day: int,
+        last_close: float,
+        anchor_day: Optional[int] = None,
+        anchor_close: float = math.nan
+    ):
+        self.params = params
+        self.sigma2 = sigma2
+        self.last_day = last_day
+        self.bars_since_fit = 0
+        self._last_close = last_close
+        self._prev_close = math.nan
+        self._prev_sigma2 = math.nan
+        self._anchor_day = anchor_day
+        self._anchor_close = anchor_close
+
+    def update(self, day: int, close: float) -> float:
+        """
+        Apply a bar, or revise the latest bar when ``day`` repeats it
+
+        Args:
+            day: Bar date as an increasing integer (e.g. epoch day)
+            close: Closing (or latest) price
+
+        Returns:
+            Next-step daily variance
+        """
+        if day < self.last_day:
+            raise ValueError("bars must arrive in date order")
+        if day == self.last_day:
+            if math.isnan(self._prev_close):
+                self._last_close = close
+                return self.sigma2
+            self.sigma2 = self._prev_sigma2
+        else:
+            self._prev_close = self._last_close
+            self._anchor_day, self._anchor_close = self.last_day, self._last_close
+            self.last_day = day
+            self.bars_since_fit += 1
+        self._last_close = close
+        self._prev_sigma2 = self.sigma2
+
+        if self._prev_close:
+            r = close / self._prev_close - 1
+            if math.isfinite(r):
+                p = self.params
+                self.sigma2 = p.omega + p.alpha * r * r + p.beta * self.sigma2
+        return self.sigma2
+
+    def matches(self, history: PriceHistory) -> bool:
+        """Whether a history still has the close this forecaster saw for its last complete bar"""
+        if self._anchor_day is None or math.isnan(self._anchor_close):
+            return True
+        close = history.close_on(self._anchor_day)
+        return close is not None and math.isclose(close, self._anchor_close, rel_tol=1e-5)
+
+    def forecast(self, horizon_days: int, periods_per_year: int = TRADING_DAYS) -> float:
+        """
+        Annualized volatility (percent) averaged over the next horizon_days
+
+        GARCH forecasts revert towards the long-run variance at the rate
+        alpha + beta; EWMA forecasts stay flat at the current estimate.
+
+        Args:
+            horizon_days: Forecast horizon in trading days
+            periods_per_year: Trading days per year
+
+        Returns:
+            Horizon-average annualized volatility in percent
+        """
+        horizon_days = max(1, int(horizon_days))
+        variance = self.sigma2
+        long_run = self.params.long_run_variance
+        if long_run is not None:
+            k = self.params.persistence
+            # Mean of long_run + k**h * (sigma2 - long_run) for h = 0..H-1
+            decay = (1 - k ** horizon_days) / ((1 - k) * horizon_days)
+            variance = long_run + (self.sigma2 - long_run) * decay
+        return math.sqrt(max(variance, 0.0) * periods_per_year) * 100
+
+
+class VolatilityForecasts:
+    """
+    Forecasters per (symbol, history key) kept in step with loaded price histories.
+
+    The key (e.g. the period string) identifies the history a forecaster
+    was fitted on, so the answer for one window never depends on which
+    windows were queried before it. ``sync`` applies only bars newer than
+    a forecaster's last day, and refits when upstream re-adjusted the
+    closes it has seen. With ``model="garch"`` parameters are fitted
+    on first use and refitted every ``refit_every`` new bars; in between
+    each bar is an O(1) update. ``fit_all`` fits a whole universe in one
+    vectorized recursion. At most ``max_forecasters`` are kept, least
+    recently used first out.
+    """
+
+    def __init__(
+        self,
+        model: str = "garch",
+        lam: float = EWMA_LAMBDA,
+        refit_every: int = 63,
+        max_forecasters: int = 4096
+    ):
+        if model not in ("garch", "ewma"):
+            raise ValueError(f"Unknown volatility model: {model}")
+        self.model = model
+        self.lam = lam
+        self.refit_every = refit_every
+        self.max_forecasters = max_forecasters
+        self._forecasters: "OrderedDict[Hashable, VolatilityForecaster]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def sync(self, symbol: str, key: Hashable, history: PriceHistory) -> Optional[VolatilityForecaster]:
+        """
+        Forecaster for a symbol and history key, updated with any new bars
+
+        Args:
+            symbol: Stock ticker symbol
+            key: History identifier, e.g. the period string
+            history: Daily closes, oldest first
+
+        Returns:
+            VolatilityForecaster, or None with fewer than 20 bars
+        """
+        if len(history) < 20:
+            return None
+        key = (symbol.upper(), key)
+        dates = history.dates
+        with self._lock:
+            forecaster = self._forecasters.get(key)
+            if (
+                forecaster is not None
+                and forecaster.bars_since_fit < self.refit_every
+                and forecaster.matches(history)
+            ):
+                start = int(np.searchsorted(dates, forecaster.last_day))
+                if start < len(dates) and int(dates[start]) == forecaster.last_day:
+                    for i in range(start, len(dates)):
+                        forecaster.update(int(dates[i]), float(history.closes[i]))
+                    self._forecasters.move_to_end(key)
+                    return forecaster
+            forecaster = self._fit({symbol: history})[symbol]
+            self._store(key, forecaster)
+            return forecaster
+
+    def fit_all(self, key: Hashable, histories: Dict[str, PriceHistory]) -> None:
+        """
+        Fit or refit many symbols at once
+
+        Args:
+            key: History identifier shared by all histories, e.g. the period string
+            histories: Symbol -> PriceHistory (symbols with < 20 bars are skipped)
+        """
+        histories = {s.upper(): h for s, h in histories.items() if len(h) >= 20}
+        if not histories:
+            return
+        fitted = self._fit(histories)
+        with self._lock:
+            for symbol, forecaster in fitted.items():
+                self._store((symbol, key), forecaster)
+
+    def get(self, symbol: str, key: Hashable) -> Optional[VolatilityForecaster]:
+        with self._lock:
+            return self._forecasters.get((symbol.upper(), key))
+
+    def __len__(self) -> int:
+        return len(self._forecasters)
+
+    def _store(self, key: Hashable, forecaster: VolatilityForecaster) -> None:
+        self._forecasters[key] = forecaster
+        self._forecasters.move_to_end(key)
+        while len(self._forecasters) > self.max_forecasters:
+            self._forecasters.popitem(last=False)
+
+    def _fit(self, histories: Dict[str, PriceHistory]) -> Dict[str, VolatilityForecaster]:
+        # Align every series on the union of dates so one recursion covers all
+        symbols = list(histories)
+        all_dates = np.unique(np.concatenate([h.dates for h in histories.values()]))
+        closes = np.full((len(all_dates), len(symbols)), np.nan)
+        for j, symbol in enumerate(symbols):
+            history = histories[symbol]
+            closes[np.searchsorted(all_dates, history.dates), j] = history.closes
+        returns = daily_returns(closes)
+
+        if self.model == "garch":
+            fit = fit_garch(returns)
+        else:
+            ewma = GarchParams.ewma(self.lam)
+            # Seed each column from its own first 20 returns, which may start
+            # at different rows, then run the recursion over the rest
+            finite = np.isfinite(returns)
+            seeding = finite & (np.cumsum(finite, axis=0) <= 20)
+            initial = np.nanvar(np.where(seeding, returns, np.nan), axis=0, ddof=1)
+            rest = np.where(seeding, np.nan, returns)
+            _, sigma2 = _recursion(rest, ewma.omega, ewma.alpha, ewma.beta, initial[None, :])
+            fit = {
+                "omega": np.zeros(len(symbols)),
+                "alpha": np.full(len(symbols), ewma.alpha),
+                "beta": np.full(len(symbols), ewma.beta),
+                "sigma2": sigma2[0],
+            }
+
+        fitted = {}
+        for j, symbol in enumerate(symbols):
+            history = histories[symbol]
+            params = GarchParams(float(fit["omega"][j]), float(fit["alpha"][j]), float(fit["beta"][j]))
+            fitted[symbol] = VolatilityForecaster(
+                params,
+                float(fit["sigma2"][j]),
+                int(history.dates[-1]),
+                float(history.closes[-1]),
+                int(history.dates[-2]),
+                float(history.closes[-2]),
+            )
+        return fitted
@@ -10,6 +10,8 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from orchestrator import Orchestrator
+from tools.data_fetcher import DataFetcher
+from tools.prewarm import prewarm_from_env
 from tools.question_parser import QuestionParser
 from tools.simple_query_handler import SimpleQueryHandler
 from tools.complex_query_handler import ComplexQueryHandler
@@ -24,6 +26,11 @@ st.set_page_config(
 # Initialize orchestrator
 @st.cache_resource
 def get_orchestrator():
+    # Interactive use: show slightly old cached data instantly, refresh in background
+    DataFetcher.stale_while_revalidate = True
+    # Fill caches for the configured watchlist before the first query runs
+    with st.spinner("Prewarming market data caches..."):
+        prewarm_from_env()
     return Orchestrator()
 
 orchestrator = get_orchestrator()
@@ -257,6 +264,8 @@ elif run_button:
         # Form input mode
         if not symbol:
             st.error("Please enter a stock symbol")
+        elif not DataFetcher.universe.contains(symbol):
+            st.error(f"Unknown symbol: {symbol}")
         else:
             # Show loading spinner
             with st.spinner(f"Analyzing {symbol}..."):